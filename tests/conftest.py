@@ -20,6 +20,24 @@ GOLDEN_DIR = FIXTURES_DIR / "golden"
 CONTRACTS_DIR = Path(__file__).parent.parent / "contracts"
 
 
+def pytest_addoption(parser):
+    """Register --run-slow for tests marked slow (100k corpora, 8 MB diffs)"""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="also run tests marked slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow is given"""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test - use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     """Return path to fixtures directory"""
@@ -62,6 +62,31 @@ class TestAPIContracts:
         assert data["status"] in ["healthy", "unhealthy"], f"Invalid status value: {data['status']}"
         assert data["database"] in ["connected", "disconnected"], f"Invalid database value: {data['database']}"
 
+    def test_ingest_run_detail_response_schema(self, client, openapi_spec):
+        """Test /ingest/runs/{run_id} response matches OpenAPI schema"""
+        health = client.get("/healthz").json()
+        run_ids = [run["run_id"] for run in health.get("last_runs", {}).values() if "run_id" in run]
+        if not run_ids:
+            pytest.skip("No ingest runs available for run detail test")
+
+        response = client.get(f"/ingest/runs/{run_ids[0]}")
+        assert response.status_code == 200, \
+            f"Expected 200, got {response.status_code}. Response: {response.text[:200]}"
+
+        data = response.json()
+        schema = openapi_spec["components"]["schemas"]["IngestRunDetail"]
+        for field in schema["required"]:
+            assert field in data, f"Missing '{field}' field. Response: {data}"
+
+        stage_fields = openapi_spec["components"]["schemas"]["IngestStageMetrics"]["required"]
+        for stage in schema["properties"]["stages"]["required"]:
+            assert stage in data["stages"], f"Missing stage '{stage}'. Stages: {data['stages']}"
+            for field in stage_fields:
+                assert field in data["stages"][stage], f"Stage '{stage}' missing '{field}'"
+
+        missing = client.get("/ingest/runs/999999999")
+        assert missing.status_code == 404, f"Unknown run should return 404, got {missing.status_code}"
+
     def test_policies_list_response_schema(self, client, openapi_spec):
         """Test /policies response matches OpenAPI schema"""
         # This endpoint REQUIRES API key - fixture includes it in headers
@@ -118,10 +118,46 @@ class TestFieldNames:
         assert actual_fields == expected_factor_fields, \
             f"Impact factors field mismatch. Expected: {expected_factor_fields}, Got: {actual_fields}"
 
+    def test_ingest_run_detail_field_names_match_dictionary(self, openapi_spec, dictionary):
+        """Verify IngestRunDetail and per-stage metric field names match dictionary.md"""
+        expected_fields = {
+            "id", "source", "status", "started_at", "finished_at",
+            "items_fetched", "items_inserted", "items_updated",
+            "duration_ms", "retries", "bytes_downloaded", "db_round_trips", "stages"
+        }
+        expected_stages = {"fetch", "normalize", "classify", "persist"}
+        expected_stage_fields = {"wall_time_ms", "items", "items_per_sec", "max_queue_depth"}
+        
+        schemas = openapi_spec["components"]["schemas"]
+        detail = schemas["IngestRunDetail"]
+        
+        assert set(detail["properties"].keys()) == expected_fields, \
+            f"IngestRunDetail field mismatch. Expected: {expected_fields}, Got: {set(detail['properties'].keys())}"
+        assert set(detail["properties"]["stages"]["properties"].keys()) == expected_stages, \
+            f"Stage names mismatch. Expected: {expected_stages}"
+        assert set(schemas["IngestStageMetrics"]["properties"].keys()) == expected_stage_fields, \
+            f"IngestStageMetrics field mismatch. Expected: {expected_stage_fields}"
+        for field in expected_fields | expected_stage_fields:
+            assert f"`{field}`" in dictionary, f"{field} not documented in dictionary.md"
+
+    def test_health_last_runs_metric_fields(self, openapi_spec, dictionary):
+        """Verify /healthz last_runs entries carry the run metrics from dictionary.md"""
+        expected_fields = {
+            "source", "status", "last_run_at", "run_id", "duration_ms",
+            "items_per_sec", "retries", "bytes_downloaded", "db_round_trips"
+        }
+        
+        last_runs = openapi_spec["components"]["schemas"]["HealthStatus"]["properties"]["last_runs"]
+        actual_fields = set(last_runs["additionalProperties"]["properties"].keys())
+        
+        assert actual_fields == expected_fields, \
+            f"last_runs field mismatch. Expected: {expected_fields}, Got: {actual_fields}"
+
     def test_route_paths_match_dictionary(self, openapi_spec, dictionary):
         """Verify route paths match dictionary.md"""
         expected_routes = {
             "/healthz",
+            "/ingest/runs/{run_id}",
             "/policies",
             "/policies/{id}",
             "/saved/{policy_id}",
@@ -0,0 +1,133 @@
+"""
+Contract tests: Validate the declarative ruleset against scoring.md and dictionary.md
+"""
+import pytest
+import json
+import yaml
+
+
+@pytest.mark.contract
+class TestRuleset:
+    """Test that contracts/ruleset.yml matches the documented rules"""
+
+    @pytest.fixture
+    def ruleset(self, contracts_dir):
+        """Load declarative ruleset"""
+        ruleset_file = contracts_dir / "ruleset.yml"
+        with open(ruleset_file, "r") as f:
+            return yaml.safe_load(f)
+
+    def test_ruleset_has_integer_version(self, ruleset):
+        """Verify ruleset declares an explicit integer version"""
+        assert "version" in ruleset, "Ruleset must declare a version"
+        assert isinstance(ruleset["version"], int) and ruleset["version"] >= 1, \
+            f"Ruleset version should be a positive integer, got {ruleset['version']!r}"
+
+    def test_keyword_family_names_match_dictionary(self, ruleset):
+        """Verify scope families use dictionary.md enum values"""
+        families = ruleset["keyword_families"]
+
+        assert set(families["scopes"]) == {"1", "2", "3"}, \
+            f"scope families mismatch, got {set(families['scopes'])}"
+
+    def test_policy_type_and_status_not_declared(self, ruleset):
+        """Verify the ruleset does not claim policy_type/status keywords it is not the source of"""
+        families = ruleset["keyword_families"]
+
+        assert "policy_type" not in families and "status" not in families, \
+            "policy_type and status keywords live in the classifier until they are exported from it"
+
+    def test_scope_keywords_match_scoring_spec(self, ruleset):
+        """Verify scope keywords are the ones listed in scoring.md 'Scope Detection'"""
+        scopes = ruleset["keyword_families"]["scopes"]
+
+        assert scopes == {
+            "1": ["scope 1", "direct emissions"],
+            "2": ["scope 2", "indirect emissions"],
+            "3": ["scope 3", "value chain", "supplier"],
+        }, f"Scope keywords mismatch, got {scopes}"
+
+    def test_keywords_consistent_with_golden_cases(self, ruleset, golden_dir):
+        """Verify no declared keyword contradicts an expected golden classification
+
+        Keywords are not the whole classifier (scopes are also inferred from
+        context), so only the keyword-implied direction is checked: a matched
+        scope keyword must be in the expected scopes, and a matched mandatory
+        keyword must mean the case is expected to be mandatory.
+        """
+        with open(golden_dir / "classification_cases.json", "r") as f:
+            cases = json.load(f)
+        families = ruleset["keyword_families"]
+
+        for case in cases:
+            text = " ".join(
+                case["input"].get(field, "") for field in ("title", "summary", "text")
+            ).lower()
+            expected = case["expected"]
+
+            matched_scopes = {
+                int(scope) for scope, keywords in families["scopes"].items()
+                if any(keyword in text for keyword in keywords)
+            }
+            assert matched_scopes <= set(expected["scopes"]), \
+                f"{case['id']}: keywords imply scopes {sorted(matched_scopes)}, expected {expected['scopes']}"
+
+            if any(keyword in text for keyword in families["mandatory"]["mandatory"]):
+                assert expected["mandatory"] is True, \
+                    f"{case['id']}: mandatory keywords matched but case is expected voluntary"
+
+    def test_keywords_are_lowercase_and_unique(self, ruleset):
+        """Verify every keyword is a non-empty lowercase string, unique within its family"""
+        for group, families in ruleset["keyword_families"].items():
+            for family, keywords in families.items():
+                assert keywords, f"{group}.{family} has no keywords"
+                assert len(keywords) == len(set(keywords)), f"{group}.{family} has duplicate keywords"
+                for keyword in keywords:
+                    assert isinstance(keyword, str) and keyword.strip(), \
+                        f"{group}.{family} has an empty or non-string keyword: {keyword!r}"
+                    assert keyword == keyword.lower(), \
+                        f"{group}.{family} keyword should be lowercase: {keyword!r}"
+
+    def test_mandatory_keywords_match_scoring_spec(self, ruleset):
+        """Verify mandatory keywords match scoring.md 'Mandatory Detection'
+
+        Voluntary is the absence of a mandatory keyword, so it has no keyword family.
+        """
+        expected = {"mandatory", "required", "must", "shall", "compliance", "penalty", "enforcement"}
+        assert set(ruleset["keyword_families"]["mandatory"]) == {"mandatory"}, \
+            f"Only the mandatory family is defined, got {set(ruleset['keyword_families']['mandatory'])}"
+        actual = set(ruleset["keyword_families"]["mandatory"]["mandatory"])
+
+        assert actual == expected, f"Mandatory keywords mismatch. Expected: {expected}, Got: {actual}"
+
+    def test_weights_match_scoring_spec(self, ruleset):
+        """Verify factor weights match scoring.md"""
+        weights = ruleset["weights"]
+
+        assert weights["mandatory"] == {"mandatory": 20, "voluntary": 10}
+        assert weights["time_proximity"]["bands"] == [
+            {"max_days": 365, "points": 20},
+            {"max_days": 730, "points": 10},
+        ]
+        assert weights["time_proximity"]["otherwise"] == 0
+        assert weights["scope_coverage"] == {"per_scope": 7, "cap": 20}
+        assert weights["sector_breadth"]["bands"] == [
+            {"max_sectors": 2, "points": 5},
+            {"max_sectors": 5, "points": 12},
+        ]
+        assert weights["sector_breadth"]["otherwise"] == 20
+        assert weights["disclosure_complexity"] == {"none": 0, "basic": 7, "moderate": 14, "high": 20}
+        assert weights["total_cap"] == 100
+
+    def test_each_factor_capped_at_20(self, ruleset):
+        """Verify no single factor can contribute more than 20 points"""
+        weights = ruleset["weights"]
+        maxima = [
+            max(weights["mandatory"].values()),
+            max(band["points"] for band in weights["time_proximity"]["bands"]),
+            weights["scope_coverage"]["cap"],
+            weights["sector_breadth"]["otherwise"],
+            max(weights["disclosure_complexity"].values()),
+        ]
+
+        assert all(points <= 20 for points in maxima), f"Factor maxima exceed 20: {maxima}"
@@ -2,7 +2,10 @@
 Integration tests: Test idempotency of ingestion pipeline
 """
 import pytest
+import math
+import re
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import AsyncMock, patch, Mock
@@ -12,7 +15,7 @@ backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from app.models.policy import Policy, Base
 from app.ingest.pipeline import IngestionPipeline
@@ -226,3 +229,131 @@ class TestIdempotency:
             policy_count2 = db_session.query(Policy).count()
             assert policy_count2 == policy_count, \
                 f"Policy count should not change, was {policy_count}, now {policy_count2}"
+
+    @staticmethod
+    @contextmanager
+    def count_policy_selects(db_session):
+        """Count SELECT statements against the policies table while the block runs"""
+        engine = db_session.get_bind()
+        counter = {"selects": 0}
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            # SQLAlchemy renders "SELECT ...\nFROM policies", so match across whitespace
+            if statement.lstrip().upper().startswith("SELECT") and \
+                    re.search(r"\bFROM\s+policies\b", statement, re.I):
+                counter["selects"] += 1
+        
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    @pytest.mark.asyncio
+    async def test_existing_items_preloaded_in_single_query(self, db_session, frozen_datetime):
+        """Test: existing items are preloaded with at most one query per batch, not one per item"""
+        batch_size = 20
+        pipeline = IngestionPipeline(db=db_session, batch_size=batch_size)
+        
+        def make_items(n):
+            return [{
+                "source_item_id": f"bulk-{i}",
+                "title_raw": f"Bulk Policy {i}",
+                "summary_raw": f"Bulk summary {i}",
+                "text_raw": f"Bulk policy text {i} with mandatory requirements",
+                "effective_date_raw": "2026-01-01",
+            } for i in range(n)]
+        
+        mock_fetcher = Mock()
+        
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            mock_fetcher.fetch = AsyncMock(return_value=make_items(50))
+            await pipeline.run(source="test_source")
+            
+            with self.count_policy_selects(db_session) as counter:
+                mock_fetcher.fetch = AsyncMock(return_value=make_items(10))
+                await pipeline.run(source="test_source")
+            small_run = counter["selects"]
+            
+            with self.count_policy_selects(db_session) as counter:
+                mock_fetcher.fetch = AsyncMock(return_value=make_items(50))
+                await pipeline.run(source="test_source")
+            large_run = counter["selects"]
+        
+        # 10 items fit in one batch; 50 items span ceil(50 / batch_size) = 3 batches
+        assert small_run == 1, f"One batch should preload existing items in one SELECT, got {small_run}"
+        assert 1 <= large_run <= math.ceil(50 / batch_size), \
+            f"Existing items should be preloaded in a single query per batch, got {large_run} SELECTs for 50 items"
+
+    @pytest.mark.asyncio
+    async def test_mixed_run_skip_update_insert_decisions(self, pipeline, db_session, test_source_data, frozen_datetime):
+        """Test: one run with unchanged, changed and new items makes the right decision for each"""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=test_source_data)
+        
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            await pipeline.run(source="test_source")
+            
+            mixed_data = [
+                test_source_data[0],  # unchanged → skip
+                {**test_source_data[1], "title_raw": "Test Policy 2 Amended"},  # changed → update
+                {
+                    "source_item_id": "test-3",  # new → insert
+                    "title_raw": "Test Policy 3",
+                    "summary_raw": "A third policy summary",
+                    "text_raw": "A third policy text with mandatory requirements",
+                    "effective_date_raw": "2026-01-03",
+                },
+            ]
+            mock_fetcher.fetch = AsyncMock(return_value=mixed_data)
+            result = await pipeline.run(source="test_source")
+        
+        assert result["items_inserted"] == 1, f"Expected 1 insert, got {result['items_inserted']}"
+        assert result["items_updated"] == 1, f"Expected 1 update, got {result['items_updated']}"
+        
+        versions = {p.source_item_id: p.version for p in db_session.query(Policy).all()}
+        assert versions == {"test-1": 1, "test-2": 2, "test-3": 1}, \
+            f"Unexpected versions after mixed run: {versions}"
+
+    @pytest.mark.asyncio
+    async def test_hash_algorithm_version_recorded(self, pipeline, db_session, test_source_data, frozen_datetime):
+        """Test: each stored policy records the hash algorithm version its hashes were made with"""
+        from app.core.hashing import HASH_ALGORITHM_VERSION
+        
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=test_source_data)
+        
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            await pipeline.run(source="test_source")
+        
+        versions = {p.hash_version for p in db_session.query(Policy).all()}
+        assert versions == {HASH_ALGORITHM_VERSION}, \
+            f"Expected hash_version {HASH_ALGORITHM_VERSION} on every policy, got {versions}"
+
+    @pytest.mark.asyncio
+    async def test_hash_algorithm_change_does_not_bump_versions(self, pipeline, db_session, test_source_data, frozen_datetime):
+        """Test: policies hashed with an older algorithm are rehashed in place, not re-versioned"""
+        from app.core.hashing import HASH_ALGORITHM_VERSION
+        
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=test_source_data)
+        
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            await pipeline.run(source="test_source")
+            
+            # Simulate rows written by a previous hash algorithm
+            for policy in db_session.query(Policy).all():
+                policy.hash_version = HASH_ALGORITHM_VERSION - 1
+                policy.content_hash = f"legacy-content-{policy.source_item_id}"
+                policy.normalized_hash = f"legacy-normalized-{policy.source_item_id}"
+            db_session.commit()
+            
+            result = await pipeline.run(source="test_source")
+        
+        assert result["items_inserted"] == 0
+        assert result["items_updated"] == 0, \
+            f"Unchanged content under a new hash algorithm is not an update, got {result['items_updated']}"
+        for policy in db_session.query(Policy).all():
+            assert policy.version == 1, f"{policy.source_item_id} should stay at version 1, got {policy.version}"
+            assert policy.hash_version == HASH_ALGORITHM_VERSION, "Hashes should be refreshed to the current algorithm"
+            assert not policy.normalized_hash.startswith("legacy-")
@@ -0,0 +1,140 @@
+"""
+Integration tests: Test persistent classification/scoring memo keyed by normalized_hash
+"""
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch, Mock
+
+# Add backend to Python path
+backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.policy import Policy, AnalysisMemoEntry, Base
+from app.ingest.pipeline import IngestionPipeline
+from app.core import memo
+from app.core.classify import classify_policy
+from app.core.scoring import calculate_impact_score
+
+
+@pytest.mark.integration
+class TestAnalysisMemo:
+    """Test that unchanged normalized content reuses stored classification and scoring"""
+
+    @pytest.fixture
+    def db_session(self, test_database_url):
+        """Create database session for tests"""
+        try:
+            engine = create_engine(test_database_url)
+            Base.metadata.create_all(engine)
+            SessionLocal = sessionmaker(bind=engine)
+            session = SessionLocal()
+
+            try:
+                yield session
+            finally:
+                session.rollback()
+                Base.metadata.drop_all(engine)
+                session.close()
+        except Exception as e:
+            pytest.skip(f"Database setup failed: {e}")
+
+    @pytest.fixture
+    def pipeline(self, db_session):
+        """Get pipeline instance; inline CPU stages so the classify/score spies see every call"""
+        return IngestionPipeline(db=db_session, cpu_workers=0)
+
+    @pytest.fixture(autouse=True)
+    def clear_memo_cache(self):
+        """Start every test with an empty in-process LRU"""
+        memo.clear_cache()
+        yield
+        memo.clear_cache()
+
+    @pytest.fixture
+    def source_data(self):
+        """Fixed test data"""
+        return [{
+            "source_item_id": "test-1",
+            "title_raw": "Test Policy",
+            "summary_raw": "Test summary",
+            "text_raw": "Test text with mandatory disclosure requirements",
+            "effective_date_raw": "2026-01-01",
+        }]
+
+    @pytest.fixture
+    def reformatted_data(self):
+        """Same normalized content, different raw content (extra whitespace) → new content_hash"""
+        return [{
+            "source_item_id": "test-1",
+            "title_raw": "Test Policy ",
+            "summary_raw": "Test  summary",
+            "text_raw": "Test text with mandatory  disclosure requirements\n",
+            "effective_date_raw": "2026-01-01",
+        }]
+
+    async def run_pipeline(self, pipeline, data):
+        """Run pipeline with a mocked fetcher, counting classify/score calls"""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=data)
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher), \
+             patch('app.ingest.pipeline.classify_policy', wraps=classify_policy) as classify_spy, \
+             patch('app.ingest.pipeline.calculate_impact_score', wraps=calculate_impact_score) as score_spy:
+            result = await pipeline.run(source="test_source")
+        return result, classify_spy.call_count, score_spy.call_count
+
+    @pytest.mark.asyncio
+    async def test_memo_row_written_on_first_ingest(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: first ingest stores classification and score factors under the current ruleset"""
+        await self.run_pipeline(pipeline, source_data)
+
+        policy = db_session.query(Policy).one()
+        entry = db_session.query(AnalysisMemoEntry).filter(
+            AnalysisMemoEntry.normalized_hash == policy.normalized_hash,
+            AnalysisMemoEntry.ruleset_version == memo.RULESET_VERSION,
+        ).one_or_none()
+
+        assert entry is not None, "Memo row should be keyed by (normalized_hash, ruleset_version)"
+        assert entry.classification["policy_type"] == policy.policy_type
+        assert entry.impact_factors == policy.impact_factors
+
+    @pytest.mark.asyncio
+    async def test_unchanged_normalized_hash_skips_classify_and_score(
+        self, pipeline, db_session, source_data, reformatted_data, frozen_datetime
+    ):
+        """Test: new content_hash with same normalized_hash reuses the memo"""
+        _, first_classify, first_score = await self.run_pipeline(pipeline, source_data)
+        assert first_classify == 1 and first_score == 1, "First ingest should classify and score once"
+
+        # Drop the in-process LRU so the hit has to come from the persistent table
+        memo.clear_cache()
+        _, second_classify, second_score = await self.run_pipeline(pipeline, reformatted_data)
+
+        assert second_classify == 0, f"classify_policy should not run on a memo hit, ran {second_classify} times"
+        assert second_score == 0, f"calculate_impact_score should not run on a memo hit, ran {second_score} times"
+
+        policy = db_session.query(Policy).one()
+        assert policy.version == 1, "Same normalized_hash should not bump the version"
+
+    @pytest.mark.asyncio
+    async def test_ruleset_bump_invalidates_memo(
+        self, pipeline, db_session, source_data, reformatted_data, frozen_datetime, monkeypatch
+    ):
+        """Test: a new ruleset version misses the memo and evicts rows from older versions"""
+        await self.run_pipeline(pipeline, source_data)
+
+        monkeypatch.setattr(memo, "RULESET_VERSION", memo.RULESET_VERSION + 1)
+        memo.clear_cache()
+        _, classify_calls, score_calls = await self.run_pipeline(pipeline, reformatted_data)
+
+        assert classify_calls == 1, "Ruleset bump should force reclassification"
+        assert score_calls == 1, "Ruleset bump should force rescoring"
+
+        evicted = memo.evict_stale(db_session)
+        versions = {row.ruleset_version for row in db_session.query(AnalysisMemoEntry).all()}
+
+        assert evicted == 1, f"One stale memo row should be evicted, got {evicted}"
+        assert versions == {memo.RULESET_VERSION}, f"Only current-version rows should remain, got {versions}"
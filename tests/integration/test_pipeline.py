@@ -228,3 +228,297 @@ class TestPipeline:
                 assert policy.created_at.year == frozen_datetime.year or \
                        policy.created_at.year == frozen_datetime.year, \
                        f"Created at year should match frozen time"
+
+    @pytest.mark.asyncio
+    async def test_batched_commits(self, db_session, frozen_datetime):
+        """Test: items are persisted in batches, one commit per batch instead of per item"""
+        source_data = [
+            {
+                "source_item_id": f"batch-{i}",
+                "title_raw": f"Batched Policy {i}",
+                "summary_raw": f"Batched summary {i}",
+                "text_raw": f"Batched policy text {i} with mandatory requirements",
+                "effective_date_raw": "2026-01-01",
+            }
+            for i in range(50)
+        ]
+        pipeline = IngestionPipeline(db=db_session, batch_size=20)
+        
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=source_data)
+        
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher), \
+             patch.object(db_session, 'commit', wraps=db_session.commit) as commit_spy:
+            result = await pipeline.run(source="test_source")
+        
+        assert result["items_inserted"] == 50, f"Expected 50 inserts, got {result['items_inserted']}"
+        # 3 item batches (20 + 20 + 10) plus the ingest_runs start/finish commits
+        assert commit_spy.call_count <= 5, \
+            f"Expected at most 5 commits for 50 items in batches of 20, got {commit_spy.call_count}"
+        assert db_session.query(Policy).count() == 50
+
+    @pytest.mark.asyncio
+    async def test_bad_item_isolated_by_batch_bisection(self, db_session, frozen_datetime):
+        """Test: one item rejected by the database does not lose the rest of its batch"""
+        source_data = [
+            {
+                "source_item_id": f"batch-{i}",
+                "title_raw": f"Batched Policy {i}",
+                "summary_raw": f"Batched summary {i}",
+                "text_raw": f"Batched policy text {i} with mandatory requirements",
+                "effective_date_raw": "2026-01-01",
+            }
+            for i in range(10)
+        ]
+        # PostgreSQL rejects NUL bytes in text columns, so this item fails at flush time
+        source_data[6]["text_raw"] = "Policy text with a NUL \x00 byte and mandatory requirements"
+        pipeline = IngestionPipeline(db=db_session, batch_size=10)
+        
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=source_data)
+        
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            result = await pipeline.run(source="test_source")
+        
+        assert result["items_inserted"] == 9, \
+            f"The 9 good items in the failing batch should still be inserted, got {result['items_inserted']}"
+        assert len(result.get("errors", [])) == 1, \
+            f"Exactly one item error should be reported, got {result.get('errors')}"
+        
+        stored = {p.source_item_id for p in db_session.query(Policy).all()}
+        assert "batch-6" not in stored, "Rejected item should not be stored"
+        assert len(stored) == 9
+        
+        ingest_run = db_session.query(IngestRun).order_by(IngestRun.started_at.desc()).first()
+        assert ingest_run.items_fetched == 10, f"items_fetched should be 10, got {ingest_run.items_fetched}"
+        assert ingest_run.items_inserted == 9, \
+            f"IngestRun.items_inserted should count only persisted items, got {ingest_run.items_inserted}"
+
+    @staticmethod
+    def slow_fetchers(delays, failing=()):
+        """get_fetcher replacement: per-source fetchers that take `delays[source]` seconds"""
+        import asyncio
+        
+        def make(source):
+            async def fetch(*args, **kwargs):
+                await asyncio.sleep(delays[source])
+                if source in failing:
+                    raise Exception(f"{source} unavailable")
+                return [{
+                    "source_item_id": f"{source}-1",
+                    "title_raw": f"{source} policy",
+                    "summary_raw": f"{source} summary",
+                    "text_raw": f"{source} policy text with mandatory requirements",
+                    "effective_date_raw": "2026-01-01",
+                }]
+            fetcher = Mock()
+            fetcher.source = source
+            fetcher.fetch = fetch
+            return fetcher
+        
+        return lambda source, *args, **kwargs: make(source)
+
+    @pytest.mark.asyncio
+    async def test_run_many_runs_sources_concurrently(self, pipeline, db_session, frozen_datetime):
+        """Test: wall-clock time of run_many tracks the slowest source, not the sum"""
+        import time
+        
+        delays = {"source_a": 0.5, "source_b": 0.5, "source_c": 0.5}
+        
+        with patch('app.ingest.pipeline.get_fetcher', side_effect=self.slow_fetchers(delays)):
+            started = time.monotonic()
+            results = await pipeline.run_many(list(delays), max_concurrency=3)
+            elapsed = time.monotonic() - started
+        
+        assert set(results) == set(delays), f"Expected a result per source, got {list(results)}"
+        assert all(r["items_inserted"] == 1 for r in results.values())
+        assert elapsed < 1.0, f"Sources should overlap (sum is 1.5s), took {elapsed:.2f}s"
+        
+        runs = db_session.query(IngestRun).all()
+        assert {run.source for run in runs} == set(delays), "Each source should get its own ingest_runs row"
+
+    @pytest.mark.asyncio
+    async def test_run_many_respects_max_concurrency(self, pipeline, db_session, frozen_datetime):
+        """Test: max_concurrency=1 runs sources one at a time"""
+        import time
+        
+        delays = {"source_a": 0.3, "source_b": 0.3, "source_c": 0.3}
+        
+        with patch('app.ingest.pipeline.get_fetcher', side_effect=self.slow_fetchers(delays)):
+            started = time.monotonic()
+            await pipeline.run_many(list(delays), max_concurrency=1)
+            elapsed = time.monotonic() - started
+        
+        assert elapsed >= 0.9, f"max_concurrency=1 should serialize sources, took {elapsed:.2f}s"
+
+    @pytest.mark.asyncio
+    async def test_run_many_isolates_source_errors(self, pipeline, db_session, frozen_datetime):
+        """Test: one failing source does not stop or roll back the others"""
+        delays = {"source_a": 0.1, "source_b": 0.1, "source_c": 0.1}
+        
+        with patch('app.ingest.pipeline.get_fetcher',
+                   side_effect=self.slow_fetchers(delays, failing={"source_b"})):
+            results = await pipeline.run_many(list(delays), max_concurrency=3)
+        
+        assert len(results["source_b"].get("errors", [])) > 0, "Failing source should report its error"
+        assert results["source_a"]["items_inserted"] == 1
+        assert results["source_c"]["items_inserted"] == 1
+        
+        statuses = {run.source: run.status for run in db_session.query(IngestRun).all()}
+        assert statuses == {"source_a": "completed", "source_b": "failed", "source_c": "completed"}, \
+            f"Unexpected ingest_runs statuses: {statuses}"
+
+    @pytest.mark.asyncio
+    async def test_run_many_shares_bounded_connection_budget(self, pipeline, db_session, frozen_datetime):
+        """Test: concurrent sources never hold more DB connections than max_db_connections"""
+        from sqlalchemy import event
+        
+        engine = db_session.get_bind()
+        usage = {"current": 0, "peak": 0}
+        
+        def on_checkout(*args):
+            usage["current"] += 1
+            usage["peak"] = max(usage["peak"], usage["current"])
+        
+        def on_checkin(*args):
+            usage["current"] -= 1
+        
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+        
+        delays = {f"source_{i}": 0.1 for i in range(6)}
+        try:
+            with patch('app.ingest.pipeline.get_fetcher', side_effect=self.slow_fetchers(delays)):
+                results = await pipeline.run_many(list(delays), max_concurrency=6, max_db_connections=2)
+        finally:
+            event.remove(engine, "checkout", on_checkout)
+            event.remove(engine, "checkin", on_checkin)
+        
+        assert all(r["items_inserted"] == 1 for r in results.values())
+        assert usage["peak"] <= 2, f"Peak DB connections should be <= 2, got {usage['peak']}"
+
+    @staticmethod
+    def make_item(i):
+        """Fixed test item"""
+        return {
+            "source_item_id": f"stream-{i}",
+            "title_raw": f"Streamed Policy {i}",
+            "summary_raw": f"Streamed summary {i}",
+            "text_raw": f"Streamed policy text {i} with mandatory requirements",
+            "effective_date_raw": "2026-01-01",
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_fetchers_adapted_to_stream(self):
+        """Test: stream_items adapts list-returning fetchers to an async item stream"""
+        from app.ingest.fetchers import stream_items
+        
+        source_data = [self.make_item(i) for i in range(3)]
+        mock_fetcher = Mock(spec=["source", "fetch"])
+        mock_fetcher.fetch = AsyncMock(return_value=source_data)
+        
+        items = [item async for item in stream_items(mock_fetcher)]
+        
+        assert items == source_data, "Adapter should yield the list fetcher's items in order"
+
+    @pytest.mark.asyncio
+    async def test_only_async_generator_stream_is_streamed(self, db_session, frozen_datetime):
+        """Test: a fetcher streams only if inspect.isasyncgenfunction(getattr(fetcher, "stream", None))
+        
+        Bare Mock() fetchers auto-create a `stream` attribute, and some fetchers have
+        a non-generator `stream` helper; both must be driven through fetch().
+        """
+        class HelperStreamFetcher:
+            source = "test_source"
+            
+            def stream(self, **kwargs):
+                raise AssertionError("a non-async-generator stream() must not be used")
+            
+            async def fetch(self, **kwargs):
+                return [TestPipeline.make_item(0)]
+        
+        bare_mock = Mock()
+        bare_mock.fetch = AsyncMock(return_value=[self.make_item(1)])
+        
+        for fetcher in (HelperStreamFetcher(), bare_mock):
+            pipeline = IngestionPipeline(db=db_session)
+            with patch('app.ingest.pipeline.get_fetcher', return_value=fetcher):
+                result = await pipeline.run(source="test_source")
+            assert result["items_inserted"] == 1, \
+                f"{type(fetcher).__name__} should be ingested through fetch()"
+        bare_mock.fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_streaming_fetcher_overlaps_processing(self, db_session, frozen_datetime):
+        """Test: items are processed while later pages are still downloading"""
+        import asyncio
+        import time
+        from app.core.classify import classify_policy
+        
+        timeline = {}
+        
+        class PagedFetcher:
+            source = "test_source"
+            
+            async def fetch(self):
+                raise AssertionError("pipeline should use stream() when a fetcher provides it")
+            
+            async def stream(self, **kwargs):
+                for page in range(5):
+                    await asyncio.sleep(0.1)  # network time per page
+                    yield [self.make_item(page * 2), self.make_item(page * 2 + 1)]
+                timeline["stream_done"] = time.monotonic()
+        
+        PagedFetcher.make_item = staticmethod(self.make_item)
+        
+        def first_classify(*args, **kwargs):
+            timeline.setdefault("first_classify", time.monotonic())
+            return classify_policy(*args, **kwargs)
+        
+        pipeline = IngestionPipeline(db=db_session, cpu_workers=0)
+        with patch('app.ingest.pipeline.get_fetcher', return_value=PagedFetcher()), \
+             patch('app.ingest.pipeline.classify_policy', side_effect=first_classify):
+            result = await pipeline.run(source="test_source")
+        
+        assert result["items_inserted"] == 10, f"Expected 10 inserts, got {result['items_inserted']}"
+        assert timeline["first_classify"] < timeline["stream_done"], \
+            "Classification should start before the last page has been downloaded"
+
+    @pytest.mark.asyncio
+    async def test_streaming_backpressure_bounds_read_ahead(self, db_session, frozen_datetime):
+        """Test: a slow consumer stops the producer from buffering the whole source"""
+        import time
+        from app.core.classify import classify_policy
+        
+        produced = {"pages": 0}
+        produced_at_classify = []
+        
+        class FastFetcher:
+            source = "test_source"
+            
+            async def stream(self, **kwargs):
+                for page in range(20):
+                    produced["pages"] += 1
+                    yield [self.make_item(page)]
+        
+        FastFetcher.make_item = staticmethod(self.make_item)
+        
+        def slow_classify(*args, **kwargs):
+            produced_at_classify.append(produced["pages"])
+            time.sleep(0.01)
+            return classify_policy(*args, **kwargs)
+        
+        pipeline = IngestionPipeline(db=db_session, stream_queue_size=2, cpu_workers=0)
+        with patch('app.ingest.pipeline.get_fetcher', return_value=FastFetcher()), \
+             patch('app.ingest.pipeline.classify_policy', side_effect=slow_classify):
+            result = await pipeline.run(source="test_source")
+        
+        assert result["items_inserted"] == 20
+        from app.ingest.pipeline import STAGES
+        
+        read_ahead = max(pages - consumed for consumed, pages in enumerate(produced_at_classify))
+        # every queue ahead of classify holds stream_queue_size pages, each upstream
+        # stage holds the page it is putting, plus the page being classified
+        upstream = STAGES.index("classify")
+        assert read_ahead <= (2 + 1) * upstream + 1, \
+            f"Producer should stay within the bounded queues, read ahead by {read_ahead} pages"
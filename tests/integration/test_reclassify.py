@@ -0,0 +1,205 @@
+"""
+Integration tests: Test checkpointed bulk reclassification of stored policies
+"""
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch, Mock
+
+# Add backend to Python path
+backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.models.policy import Policy, PolicyChangesLog, ReclassifyRun, Base
+from app.ingest.pipeline import IngestionPipeline
+from app.ingest.reclassify import ReclassificationJob
+from app.core.classify import classify_policies
+
+
+@pytest.mark.integration
+class TestReclassification:
+    """Test reclassifying and rescoring the catalog without touching upstream sources"""
+
+    @pytest.fixture
+    def db_session(self, test_database_url):
+        """Create database session for tests"""
+        try:
+            engine = create_engine(test_database_url)
+            Base.metadata.create_all(engine)
+            SessionLocal = sessionmaker(bind=engine)
+            session = SessionLocal()
+
+            try:
+                yield session
+            finally:
+                session.rollback()
+                Base.metadata.drop_all(engine)
+                session.close()
+        except Exception as e:
+            pytest.skip(f"Database setup failed: {e}")
+
+    @pytest.fixture
+    def pipeline(self, db_session):
+        """Get pipeline instance"""
+        return IngestionPipeline(db=db_session)
+
+    @pytest.fixture
+    def source_data(self):
+        """Ten fixed policies so the job runs in several batches"""
+        return [
+            {
+                "source_item_id": f"test-{i}",
+                "title_raw": f"Test Policy {i}",
+                "summary_raw": f"Test summary {i}",
+                "text_raw": f"Test policy text {i} with mandatory disclosure requirements",
+                "effective_date_raw": "2026-01-01",
+            }
+            for i in range(10)
+        ]
+
+    async def ingest(self, pipeline, db_session, source_data):
+        """Ingest the fixed policies once and return them in id order"""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=source_data)
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            result = await pipeline.run(source="test_source")
+        assert result["items_inserted"] == len(source_data)
+        return db_session.query(Policy).order_by(Policy.id).all()
+
+    @staticmethod
+    def changed_ruleset(changed_titles):
+        """classify_policies replacement: real results, but policy_type changes for some titles"""
+        def classify(items, workers=1, **kwargs):
+            items = list(items)
+            results = classify_policies(items, workers=1)
+            for item, result in zip(items, results):
+                if item[0] in changed_titles:
+                    result["policy_type"] = "Pricing" if result["policy_type"] != "Pricing" else "Ban"
+            return results
+        return classify
+
+    @pytest.mark.asyncio
+    async def test_unchanged_rules_leave_policies_untouched(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: reclassifying with the same rules changes no versions and logs nothing"""
+        ingested = await self.ingest(pipeline, db_session, source_data)
+        result = ReclassificationJob(db=db_session, batch_size=3).run()
+
+        assert result["policies_scanned"] == len(ingested)
+        assert result["policies_updated"] == 0, \
+            f"Same rules should update 0 policies, updated {result['policies_updated']}"
+        assert all(p.version == 1 for p in db_session.query(Policy).all()), "No version should change"
+        assert db_session.query(PolicyChangesLog).count() == 0, "No change log entries expected"
+
+    @pytest.mark.asyncio
+    async def test_changed_classification_bumps_version_and_logs(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: policies whose classification changes follow the version-bump and change-log rules"""
+        await self.ingest(pipeline, db_session, source_data)
+        changed = {"Test Policy 2", "Test Policy 7"}
+
+        with patch('app.ingest.reclassify.classify_policies', side_effect=self.changed_ruleset(changed)):
+            result = ReclassificationJob(db=db_session, batch_size=3).run()
+
+        assert result["policies_updated"] == 2, f"Expected 2 updated policies, got {result['policies_updated']}"
+        for policy in db_session.query(Policy).all():
+            expected_version = 2 if policy.title in changed else 1
+            assert policy.version == expected_version, \
+                f"{policy.title}: expected version {expected_version}, got {policy.version}"
+
+        logs = db_session.query(PolicyChangesLog).all()
+        assert len(logs) == 2, f"Expected 2 change log entries, got {len(logs)}"
+        for log in logs:
+            assert log.version_from == 1 and log.version_to == 2
+            assert "policy_type" in log.diff, f"diff should record the policy_type change, got {log.diff}"
+
+    @pytest.mark.asyncio
+    async def test_policies_streamed_with_server_side_cursor(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: policies are read through a streaming cursor (yield_per), not loaded all at once"""
+        await self.ingest(pipeline, db_session, source_data)
+        policy_selects = []
+
+        def record_select(orm_execute_state):
+            if orm_execute_state.is_select and any(
+                mapper.class_ is Policy for mapper in orm_execute_state.all_mappers
+            ):
+                policy_selects.append(dict(orm_execute_state.execution_options))
+
+        event.listen(db_session, "do_orm_execute", record_select)
+        try:
+            ReclassificationJob(db=db_session, batch_size=3).run()
+        finally:
+            event.remove(db_session, "do_orm_execute", record_select)
+
+        assert policy_selects, "The job should read policies through the ORM session"
+        for options in policy_selects:
+            assert options.get("yield_per") or options.get("stream_results"), \
+                f"Policies should be streamed with yield_per or stream_results, got options {options}"
+
+    @pytest.mark.asyncio
+    async def test_classified_in_chunks_of_batch_size(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: each batch goes to classify_policies as one chunk with the job's worker count"""
+        await self.ingest(pipeline, db_session, source_data)
+        chunks = []
+
+        def record_chunk(items, workers=1, **kwargs):
+            items = list(items)
+            chunks.append((len(items), workers))
+            return classify_policies(items, workers=1)
+
+        with patch('app.ingest.reclassify.classify_policies', side_effect=record_chunk):
+            ReclassificationJob(db=db_session, batch_size=3, workers=2).run()
+
+        assert chunks == [(3, 2), (3, 2), (3, 2), (1, 2)], \
+            f"10 policies in batches of 3 should be 4 chunks classified with 2 workers, got {chunks}"
+
+    @pytest.mark.asyncio
+    async def test_never_fetches_from_upstream(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: the job reads only the policies table, never a source fetcher"""
+        ingested = await self.ingest(pipeline, db_session, source_data)
+        with patch('app.ingest.pipeline.get_fetcher', side_effect=AssertionError("fetcher called")), \
+             patch('app.ingest.fetchers.get_fetcher', side_effect=AssertionError("fetcher called")):
+            result = ReclassificationJob(db=db_session, batch_size=3).run()
+
+        assert result["policies_scanned"] == len(ingested)
+
+    @pytest.mark.asyncio
+    async def test_crash_resumes_from_checkpoint(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: a crash mid-run leaves a checkpoint and the next run resumes after it"""
+        ingested = await self.ingest(pipeline, db_session, source_data)
+        calls = {"n": 0}
+
+        def crash_on_second_batch(items, workers=1, **kwargs):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise RuntimeError("worker died")
+            return classify_policies(items, workers=1)
+
+        with patch('app.ingest.reclassify.classify_policies', side_effect=crash_on_second_batch):
+            with pytest.raises(RuntimeError):
+                ReclassificationJob(db=db_session, batch_size=3).run()
+
+        failed = db_session.query(ReclassifyRun).order_by(ReclassifyRun.id.desc()).first()
+        assert failed is not None, "reclassify run should be recorded"
+        assert failed.status == "failed"
+        assert failed.last_policy_id == ingested[2].id, \
+            f"Checkpoint should be the last id of the first committed batch, got {failed.last_policy_id}"
+
+        scanned_titles = []
+
+        def record(items, workers=1, **kwargs):
+            items = list(items)
+            scanned_titles.extend(item[0] for item in items)
+            return classify_policies(items, workers=1)
+
+        with patch('app.ingest.reclassify.classify_policies', side_effect=record):
+            result = ReclassificationJob(db=db_session, batch_size=3).run(resume=True)
+
+        assert result["policies_scanned"] == len(ingested) - 3, \
+            f"Resumed run should scan only the remaining policies, scanned {result['policies_scanned']}"
+        assert "Test Policy 0" not in scanned_titles, "Checkpointed policies should not be reprocessed"
+
+        resumed = db_session.query(ReclassifyRun).order_by(ReclassifyRun.id.desc()).first()
+        assert resumed.status == "completed"
+        assert resumed.last_policy_id == ingested[-1].id
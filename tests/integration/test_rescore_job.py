@@ -0,0 +1,140 @@
+"""
+Integration tests: Test incremental time-proximity rescoring of stored policies
+"""
+import pytest
+import sys
+from pathlib import Path
+from datetime import date
+from unittest.mock import AsyncMock, patch, Mock
+
+# Add backend to Python path
+backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.policy import Policy, RescoreRun, Base
+from app.ingest.pipeline import IngestionPipeline
+from app.core.rescoring import rescore_due_policies
+
+
+@pytest.mark.integration
+class TestRescoring:
+    """Test that only policies crossing a time-proximity boundary are rescored"""
+
+    @pytest.fixture
+    def db_session(self, test_database_url):
+        """Create database session for tests"""
+        try:
+            engine = create_engine(test_database_url)
+            Base.metadata.create_all(engine)
+            SessionLocal = sessionmaker(bind=engine)
+            session = SessionLocal()
+
+            try:
+                yield session
+            finally:
+                session.rollback()
+                Base.metadata.drop_all(engine)
+                session.close()
+        except Exception as e:
+            pytest.skip(f"Database setup failed: {e}")
+
+    @pytest.fixture
+    def pipeline(self, db_session):
+        """Get pipeline instance"""
+        return IngestionPipeline(db=db_session)
+
+    @pytest.fixture
+    def source_data(self):
+        """One policy inside the 12-month band, one in the 12-24 month band (as of 2025-10-15)"""
+        return [
+            {
+                "source_item_id": "test-near",
+                "title_raw": "Near Term Policy",
+                "summary_raw": "Effective soon",
+                "text_raw": "Near term policy text with mandatory requirements",
+                "effective_date_raw": "2026-01-01",
+            },
+            {
+                "source_item_id": "test-mid",
+                "title_raw": "Mid Term Policy",
+                "summary_raw": "Effective in 2027",
+                "text_raw": "Mid term policy text with mandatory requirements",
+                "effective_date_raw": "2027-06-01",
+            },
+        ]
+
+    async def ingest(self, pipeline, source_data):
+        """Run the pipeline once with a mocked fetcher"""
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=source_data)
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            result = await pipeline.run(source="test_source")
+        assert result["items_inserted"] == len(source_data)
+
+    @pytest.mark.asyncio
+    async def test_next_rescore_date_stored_on_ingest(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: ingest stores each policy's next boundary-crossing date"""
+        await self.ingest(pipeline, source_data)
+
+        near = db_session.query(Policy).filter(Policy.source_item_id == "test-near").one()
+        mid = db_session.query(Policy).filter(Policy.source_item_id == "test-mid").one()
+
+        assert near.next_rescore_at is None, \
+            f"Policy within 12 months should have no pending boundary, got {near.next_rescore_at}"
+        assert mid.next_rescore_at == date(2026, 6, 1), \
+            f"Policy effective 2027-06-01 should cross into the 12-month band on 2026-06-01, got {mid.next_rescore_at}"
+
+    @pytest.mark.asyncio
+    async def test_only_boundary_crossing_policies_rescored(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: rescoring updates only policies whose band changed and records the count"""
+        await self.ingest(pipeline, source_data)
+
+        near = db_session.query(Policy).filter(Policy.source_item_id == "test-near").one()
+        mid = db_session.query(Policy).filter(Policy.source_item_id == "test-mid").one()
+        near_score, mid_score = near.impact_score, mid.impact_score
+        assert mid.impact_factors["time_proximity"] == 10
+
+        result = rescore_due_policies(db_session, today=date(2026, 6, 1))
+
+        assert result["policies_rescored"] == 1, \
+            f"Only the 12-24 month policy should be rescored, got {result['policies_rescored']}"
+
+        db_session.refresh(near)
+        db_session.refresh(mid)
+        assert near.impact_score == near_score, "Policy without a boundary crossing should be untouched"
+        assert mid.impact_factors["time_proximity"] == 20, "Crossed policy should move to the 12-month band"
+        assert mid.impact_score == mid_score + 10, \
+            f"Impact score should rise by 10, was {mid_score}, now {mid.impact_score}"
+        assert mid.next_rescore_at is None, "No further boundary once inside 12 months"
+
+        run = db_session.query(RescoreRun).order_by(RescoreRun.id.desc()).first()
+        assert run is not None, "rescore run should be recorded"
+        assert run.run_date == date(2026, 6, 1)
+        assert run.policies_rescored == 1
+
+    @pytest.mark.asyncio
+    async def test_rescoring_is_idempotent_per_day(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: running the job twice on the same day rescores nothing the second time"""
+        await self.ingest(pipeline, source_data)
+
+        rescore_due_policies(db_session, today=date(2026, 6, 1))
+        second = rescore_due_policies(db_session, today=date(2026, 6, 1))
+
+        assert second["policies_rescored"] == 0, \
+            f"Second run on the same day should rescore 0 policies, got {second['policies_rescored']}"
+        assert db_session.query(RescoreRun).count() == 2, "Each run should be recorded"
+
+    @pytest.mark.asyncio
+    async def test_missed_days_catch_up(self, pipeline, db_session, source_data, frozen_datetime):
+        """Test: a run after several skipped days rescores every boundary passed in between"""
+        await self.ingest(pipeline, source_data)
+
+        result = rescore_due_policies(db_session, today=date(2026, 9, 1))
+
+        assert result["policies_rescored"] == 1, \
+            f"Boundary passed while the job was not running should still be applied, got {result['policies_rescored']}"
+        mid = db_session.query(Policy).filter(Policy.source_item_id == "test-mid").one()
+        assert mid.impact_factors["time_proximity"] == 20
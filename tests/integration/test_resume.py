@@ -0,0 +1,165 @@
+"""
+Integration tests: Test resumable ingest runs with page-level checkpoints
+"""
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add backend to Python path
+backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.policy import Policy, IngestRun, Base
+from app.ingest.pipeline import IngestionPipeline
+from app.core.classify import classify_policy
+
+
+class CursorFetcher:
+    """Paged streaming fetcher whose `state` is the cursor to resume after the last yielded page"""
+
+    source = "test_source"
+
+    def __init__(self, pages=5, per_page=2, fail_at_page=None):
+        self.pages = pages
+        self.per_page = per_page
+        self.fail_at_page = fail_at_page
+        self.state = None
+        self.started_from = "not started"
+
+    async def stream(self, state=None, **kwargs):
+        self.started_from = state
+        start = state["cursor"] if state else 0
+        for page in range(start, self.pages):
+            if page == self.fail_at_page:
+                raise RuntimeError("worker restarted")
+            self.state = {"cursor": page + 1}
+            yield [
+                {
+                    "source_item_id": f"page-{page}-{i}",
+                    "title_raw": f"Backfill Policy {page}-{i}",
+                    "summary_raw": f"Backfill summary {page}-{i}",
+                    "text_raw": f"Backfill policy text {page}-{i} with mandatory requirements",
+                    "effective_date_raw": "2026-01-01",
+                }
+                for i in range(self.per_page)
+            ]
+
+
+@pytest.mark.integration
+class TestResumableRuns:
+    """Test that a run that dies partway continues from its last persisted page"""
+
+    @pytest.fixture
+    def db_session(self, test_database_url):
+        """Create database session for tests"""
+        try:
+            engine = create_engine(test_database_url)
+            Base.metadata.create_all(engine)
+            SessionLocal = sessionmaker(bind=engine)
+            session = SessionLocal()
+
+            try:
+                yield session
+            finally:
+                session.rollback()
+                Base.metadata.drop_all(engine)
+                session.close()
+        except Exception as e:
+            pytest.skip(f"Database setup failed: {e}")
+
+    @pytest.fixture
+    def pipeline(self, db_session):
+        """Get pipeline instance; inline CPU stages so the classify spy sees every call"""
+        return IngestionPipeline(db=db_session, cpu_workers=0)
+
+    async def crashed_run(self, pipeline, db_session):
+        """Run a backfill that dies on page 3 of 5 and return its IngestRun
+
+        Like any source failure, the error is recorded on the run and returned
+        in `errors` rather than raised.
+        """
+        with patch('app.ingest.pipeline.get_fetcher', return_value=CursorFetcher(fail_at_page=3)):
+            result = await pipeline.run(source="test_source")
+        assert any("worker restarted" in str(error) for error in result.get("errors", [])), \
+            f"The fetch failure should be reported in errors, got {result.get('errors')}"
+        assert result["items_inserted"] == 6, "Pages persisted before the failure should be counted"
+        return db_session.query(IngestRun).filter(IngestRun.id == result["run_id"]).one()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_records_last_persisted_page(self, pipeline, db_session, frozen_datetime):
+        """Test: a failed run keeps the fetcher state after its last fully persisted page"""
+        failed = await self.crashed_run(pipeline, db_session)
+
+        assert failed.status == "failed"
+        assert failed.checkpoint["fetcher_state"] == {"cursor": 3}, \
+            f"Checkpoint should point after page 2, got {failed.checkpoint}"
+        assert failed.checkpoint["pages"] == 3
+        assert db_session.query(Policy).count() == 6, "Pages 0-2 should already be persisted"
+
+    @pytest.mark.asyncio
+    async def test_resume_continues_from_checkpoint(self, pipeline, db_session, frozen_datetime):
+        """Test: resume=True restarts the fetcher from the checkpoint and skips finished pages"""
+        failed = await self.crashed_run(pipeline, db_session)
+        fetcher = CursorFetcher()
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=fetcher), \
+             patch('app.ingest.pipeline.classify_policy', wraps=classify_policy) as classify_spy:
+            result = await pipeline.run(source="test_source", resume=True)
+
+        assert fetcher.started_from == {"cursor": 3}, f"Fetcher should resume at cursor 3, got {fetcher.started_from}"
+        assert result["items_fetched"] == 4, f"Only pages 3-4 should be fetched, got {result['items_fetched']}"
+        assert result["items_inserted"] == 4
+        assert classify_spy.call_count == 4, "Items persisted before the crash should not be processed again"
+        assert db_session.query(Policy).count() == 10
+
+        db_session.refresh(failed)
+        resumed = db_session.query(IngestRun).filter(IngestRun.id == result["run_id"]).one()
+        assert failed.status == "resumed", f"The interrupted run should be marked resumed, got {failed.status}"
+        assert resumed.resumed_from_id == failed.id
+        assert resumed.status == "completed"
+        assert resumed.checkpoint["fetcher_state"] == {"cursor": 5}
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_resumed_only_once(self, pipeline, db_session, frozen_datetime):
+        """Test: after a successful resume, the next resume=True run starts fresh"""
+        await self.crashed_run(pipeline, db_session)
+        with patch('app.ingest.pipeline.get_fetcher', return_value=CursorFetcher()):
+            await pipeline.run(source="test_source", resume=True)
+
+        fetcher = CursorFetcher()
+        with patch('app.ingest.pipeline.get_fetcher', return_value=fetcher):
+            result = await pipeline.run(source="test_source", resume=True)
+
+        assert fetcher.started_from is None, "A resumed checkpoint should not be resumed again"
+        assert result["items_inserted"] == 0, "Everything is already stored"
+
+    @pytest.mark.asyncio
+    async def test_resume_without_failed_run_is_a_normal_run(self, pipeline, db_session, frozen_datetime):
+        """Test: resume=True with nothing to resume fetches from the start"""
+        fetcher = CursorFetcher()
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=fetcher):
+            result = await pipeline.run(source="test_source", resume=True)
+
+        assert fetcher.started_from is None
+        assert result["items_inserted"] == 10
+        run = db_session.query(IngestRun).filter(IngestRun.id == result["run_id"]).one()
+        assert run.resumed_from_id is None
+        assert run.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_without_resume_failed_run_is_not_continued(self, pipeline, db_session, frozen_datetime):
+        """Test: the default run ignores checkpoints and leaves the failed run as failed"""
+        failed = await self.crashed_run(pipeline, db_session)
+        fetcher = CursorFetcher()
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=fetcher):
+            await pipeline.run(source="test_source")
+
+        db_session.refresh(failed)
+        assert fetcher.started_from is None
+        assert failed.status == "failed"
@@ -0,0 +1,234 @@
+"""
+Integration tests: Test pipelined ingest stages with CPU work off the event loop
+
+All inter-stage queues are bounded by the same `stream_queue_size` knob as the
+fetch stream. `cpu_workers` selects where the CPU stages (normalize, classify)
+run:
+
+- None (default): in a worker thread via `asyncio.to_thread`, off the event loop
+- N > 0: in a process pool of N workers
+- 0: inline on the event loop; only for tests that spy on module-level functions
+"""
+import pytest
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch, Mock
+
+# Add backend to Python path
+backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.policy import Policy, Base
+from app.ingest.pipeline import IngestionPipeline, STAGES
+
+
+@pytest.mark.integration
+class TestPipelineStages:
+    """Test fetch -> normalize/hash -> classify/score -> persist joined by bounded queues"""
+
+    @pytest.fixture
+    def db_session(self, test_database_url):
+        """Create database session for tests"""
+        try:
+            engine = create_engine(test_database_url)
+            Base.metadata.create_all(engine)
+            SessionLocal = sessionmaker(bind=engine)
+            session = SessionLocal()
+
+            try:
+                yield session
+            finally:
+                session.rollback()
+                Base.metadata.drop_all(engine)
+                session.close()
+        except Exception as e:
+            pytest.skip(f"Database setup failed: {e}")
+
+    @staticmethod
+    def make_item(i, text_repeat=1):
+        """Fixed test item; text_repeat makes classification and hashing expensive"""
+        return {
+            "source_item_id": f"stage-{i}",
+            "title_raw": f"Staged Policy {i}",
+            "summary_raw": f"Staged summary {i}",
+            "text_raw": f"Staged policy text {i} with mandatory disclosure requirements. " * text_repeat,
+            "effective_date_raw": "2026-01-01",
+        }
+
+    @staticmethod
+    def fetcher(items):
+        mock_fetcher = Mock()
+        mock_fetcher.fetch = AsyncMock(return_value=items)
+        return mock_fetcher
+
+    def test_stage_names(self):
+        """Test: the pipeline declares its stages in order"""
+        assert list(STAGES) == ["fetch", "normalize", "classify", "persist"]
+
+    @pytest.mark.asyncio
+    async def test_cpu_stages_off_loop_by_default(self, db_session, frozen_datetime):
+        """Test: by default classification runs on a worker thread, not the event loop thread"""
+        from app.core.classify import classify_policy
+
+        items = [self.make_item(i) for i in range(5)]
+        pipeline = IngestionPipeline(db=db_session)
+        loop_thread = threading.get_ident()
+        classify_threads = set()
+
+        def recording_classify(*args, **kwargs):
+            classify_threads.add(threading.get_ident())
+            return classify_policy(*args, **kwargs)
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)), \
+             patch('app.ingest.pipeline.classify_policy', side_effect=recording_classify):
+            result = await pipeline.run(source="test_source")
+
+        assert pipeline.cpu_workers is None
+        assert result["items_inserted"] == 5
+        assert classify_threads and loop_thread not in classify_threads, \
+            "Default classification should not run on the event loop thread"
+
+    @pytest.mark.asyncio
+    async def test_cpu_workers_zero_runs_inline(self, db_session, frozen_datetime):
+        """Test: cpu_workers=0 classifies on the event loop thread, visible to patches"""
+        from app.core.classify import classify_policy
+
+        items = [self.make_item(i) for i in range(5)]
+        pipeline = IngestionPipeline(db=db_session, cpu_workers=0)
+        loop_thread = threading.get_ident()
+        classify_threads = set()
+
+        def recording_classify(*args, **kwargs):
+            classify_threads.add(threading.get_ident())
+            return classify_policy(*args, **kwargs)
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)), \
+             patch('app.ingest.pipeline.classify_policy', side_effect=recording_classify) as classify_spy:
+            await pipeline.run(source="test_source")
+
+        assert classify_spy.call_count == 5, \
+            f"Inline classification should be visible to patches, saw {classify_spy.call_count} calls"
+        assert classify_threads == {loop_thread}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cpu_workers", [None, 2], ids=["default", "process-pool"])
+    async def test_event_loop_stays_responsive(self, db_session, frozen_datetime, cpu_workers):
+        """Test: CPU-heavy items do not block the event loop while they are processed"""
+        # ~1 MB of text per item
+        items = [self.make_item(i, text_repeat=16_000) for i in range(8)]
+        pipeline = IngestionPipeline(db=db_session, cpu_workers=cpu_workers)
+        gaps = []
+        done = asyncio.Event()
+
+        async def ticker():
+            last = time.monotonic()
+            while not done.is_set():
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        tick = asyncio.create_task(ticker())
+        with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)):
+            result = await pipeline.run(source="test_source")
+        done.set()
+        await tick
+
+        assert result["items_inserted"] == len(items)
+        assert max(gaps) < 0.1, f"Event loop was blocked for {max(gaps):.3f}s during ingest"
+
+    @pytest.mark.asyncio
+    async def test_db_writes_run_on_dedicated_thread(self, db_session, frozen_datetime):
+        """Test: every commit happens on one DB thread, never on the event loop thread"""
+        items = [self.make_item(i) for i in range(10)]
+        pipeline = IngestionPipeline(db=db_session, batch_size=4)
+        loop_thread = threading.get_ident()
+        commit_threads = set()
+        original_commit = db_session.commit
+
+        def recording_commit():
+            commit_threads.add(threading.get_ident())
+            return original_commit()
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)), \
+             patch.object(db_session, 'commit', side_effect=recording_commit):
+            result = await pipeline.run(source="test_source")
+
+        assert result["items_inserted"] == 10
+        assert loop_thread not in commit_threads, "Commits should not run on the event loop thread"
+        assert len(commit_threads) == 1, f"Commits should use one DB thread, used {len(commit_threads)}"
+
+    @pytest.mark.asyncio
+    async def test_stage_throughput_reported(self, db_session, frozen_datetime):
+        """Test: each stage reports items, wall time and throughput in the IngestStageMetrics shape"""
+        from app.core.classify import classify_policy
+
+        items = [self.make_item(i) for i in range(20)]
+        pipeline = IngestionPipeline(db=db_session, cpu_workers=0)
+
+        def slow_classify(*args, **kwargs):
+            time.sleep(0.02)
+            return classify_policy(*args, **kwargs)
+
+        # 20 x 20ms makes classify the clear bottleneck regardless of timer resolution
+        with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)), \
+             patch('app.ingest.pipeline.classify_policy', side_effect=slow_classify):
+            result = await pipeline.run(source="test_source")
+
+        stages = result["stages"]
+        assert list(stages) == list(STAGES), f"Expected stats for every stage, got {list(stages)}"
+        for name, stats in stages.items():
+            assert stats["items"] == 20, f"{name}: expected 20 items, got {stats['items']}"
+            assert isinstance(stats["wall_time_ms"], int) and stats["wall_time_ms"] >= 0
+            assert stats["items_per_sec"] >= 0
+        assert stages["classify"]["wall_time_ms"] >= 400
+        assert result["bottleneck"] == "classify", \
+            f"bottleneck should name the stage with the most busy time, got {result['bottleneck']}"
+
+    @pytest.mark.asyncio
+    async def test_queues_are_bounded(self, db_session, frozen_datetime):
+        """Test: no inter-stage queue grows past stream_queue_size"""
+        items = [self.make_item(i) for i in range(50)]
+        pipeline = IngestionPipeline(db=db_session, stream_queue_size=4)
+
+        with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)):
+            result = await pipeline.run(source="test_source")
+
+        assert result["items_inserted"] == 50
+        for name, stats in result["stages"].items():
+            assert stats["max_queue_depth"] <= 4, \
+                f"{name} input queue reached {stats['max_queue_depth']} items, limit is 4"
+
+    @pytest.mark.asyncio
+    async def test_staged_run_matches_inline_run(self, test_database_url, frozen_datetime):
+        """Test: thread and process-pool stages store the same policies as inline processing"""
+        items = [self.make_item(i) for i in range(12)]
+        stored = {}
+
+        for workers in (0, None, 2):
+            try:
+                engine = create_engine(test_database_url)
+                Base.metadata.create_all(engine)
+                session = sessionmaker(bind=engine)()
+            except Exception as e:
+                pytest.skip(f"Database setup failed: {e}")
+            try:
+                pipeline = IngestionPipeline(db=session, cpu_workers=workers)
+                with patch('app.ingest.pipeline.get_fetcher', return_value=self.fetcher(items)):
+                    await pipeline.run(source="test_source")
+                stored[workers] = [
+                    (p.source_item_id, p.policy_type, p.status, p.impact_score, p.content_hash)
+                    for p in session.query(Policy).order_by(Policy.source_item_id).all()
+                ]
+            finally:
+                session.rollback()
+                Base.metadata.drop_all(engine)
+                session.close()
+
+        assert stored[0] == stored[None] == stored[2], "cpu_workers should not change what is stored"
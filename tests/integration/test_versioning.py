@@ -317,3 +317,84 @@ class TestVersioning:
             if "title" in change_log.diff:
                 assert change_log.diff["title"]["old"] == original_title, \
                     "Original title should be in diff"
+
+    @staticmethod
+    def revision(n, text_repeat=1):
+        """Source item at revision n; text_repeat makes the text long"""
+        return [{
+            "source_item_id": "test-1",
+            "title_raw": "Policy Title" if n < 3 else "Policy Title (amended)",
+            "summary_raw": f"Summary revision {n}",
+            "text_raw": "".join(
+                f"Article {i}. Large undertakings shall disclose scope {i % 3 + 1} emissions.\n"
+                for i in range(text_repeat)
+            ) + f"Final article, revision {n}, with mandatory requirements",
+            "effective_date_raw": "2026-01-01",
+        }]
+
+    async def ingest_revisions(self, pipeline, db_session, count, text_repeat=1):
+        """Ingest `count` successive revisions of one policy and return it"""
+        mock_fetcher = Mock()
+        with patch('app.ingest.pipeline.get_fetcher', return_value=mock_fetcher):
+            for n in range(1, count + 1):
+                mock_fetcher.fetch = AsyncMock(return_value=self.revision(n, text_repeat))
+                await pipeline.run(source="test_source")
+        policy = db_session.query(Policy).filter(Policy.source_item_id == "test-1").one()
+        assert policy.version == count
+        return policy
+
+    @pytest.mark.asyncio
+    async def test_any_version_reconstructable(self, pipeline, db_session, frozen_datetime):
+        """Test: reconstruct_version returns the exact fields of every past version"""
+        from app.core.history import reconstruct_version, SNAPSHOT_INTERVAL
+        
+        count = 2 * SNAPSHOT_INTERVAL + 1
+        policy = await self.ingest_revisions(pipeline, db_session, count)
+        
+        for n in range(1, count + 1):
+            expected = self.revision(n)[0]
+            fields = reconstruct_version(db_session, policy.id, n)
+            assert fields["summary"] == expected["summary_raw"], f"Version {n}: summary mismatch"
+            assert fields["text"] == expected["text_raw"], f"Version {n}: text mismatch"
+            assert fields["title"] == expected["title_raw"], f"Version {n}: title mismatch"
+        
+        with pytest.raises(LookupError):
+            reconstruct_version(db_session, policy.id, count + 1)
+
+    @pytest.mark.asyncio
+    async def test_change_log_stores_deltas_not_full_texts(self, pipeline, db_session, frozen_datetime):
+        """Test: revisions of a long text cost a small fraction of storing old and new values"""
+        import json
+        
+        count = 6
+        policy = await self.ingest_revisions(pipeline, db_session, count, text_repeat=1500)
+        
+        logs = db_session.query(PolicyChangesLog).filter(PolicyChangesLog.policy_id == policy.id).all()
+        stored = sum(
+            len(log.delta or b"") + len(log.snapshot or b"") + len(json.dumps(log.diff))
+            for log in logs
+        )
+        full_values = 2 * (count - 1) * len(self.revision(1, 1500)[0]["text_raw"])
+        
+        assert len(logs) == count - 1
+        assert stored < full_values * 0.1, \
+            f"Change log stores {stored} bytes, full old/new values would be {full_values}"
+        for log in logs:
+            assert "old" not in log.diff.get("text", {}), "Long texts should not be copied into diff"
+
+    @pytest.mark.asyncio
+    async def test_history_keeps_contract_shape(self, pipeline, db_session, frozen_datetime):
+        """Test: history entries built from deltas keep the PolicyDetail.history shape"""
+        from app.core.history import build_history
+        
+        policy = await self.ingest_revisions(pipeline, db_session, 3)
+        history = build_history(db_session, policy.id)
+        
+        assert [(h["version_from"], h["version_to"]) for h in history] == [(1, 2), (2, 3)]
+        for entry in history:
+            assert set(entry) == {"changed_at", "version_from", "version_to", "diff"}, \
+                f"Unexpected history keys {set(entry)}"
+            assert isinstance(entry["changed_at"], str)
+            assert isinstance(entry["diff"], dict) and entry["diff"], "diff should summarize the change"
+        assert history[1]["diff"]["title"] == {"old": "Policy Title", "new": "Policy Title (amended)"}, \
+            "Short fields keep old/new values in the diff summary"
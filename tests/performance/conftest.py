@@ -0,0 +1,152 @@
+"""
+Shared fixtures for performance benchmarks: synthetic corpora, timing and baselines
+"""
+import pytest
+import json
+import math
+import os
+import random
+import time
+from pathlib import Path
+from datetime import date, timedelta
+
+import yaml
+
+PERFORMANCE_DIR = Path(__file__).parent
+BENCHMARK_BASELINE = PERFORMANCE_DIR.parent / "fixtures" / "benchmarks" / "baseline.json"
+# Repo root, where .gitignore ignores it
+BENCHMARK_OUTPUT = PERFORMANCE_DIR.parent.parent / "benchmark_results.json"
+RULESET_FILE = PERFORMANCE_DIR.parent.parent / "contracts" / "ruleset.yml"
+
+# Fixed seed so every run benchmarks the same corpus
+CORPUS_SEED = 20251015
+
+FILLER_WORDS = [
+    "the", "of", "and", "to", "in", "companies", "member", "states", "shall", "article",
+    "annex", "paragraph", "provided", "pursuant", "relevant", "authority", "measures",
+    "period", "information", "public", "commission", "regulation", "directive", "national",
+]
+
+
+def load_vocabulary():
+    """All keywords declared in contracts/ruleset.yml"""
+    with open(RULESET_FILE, "r") as f:
+        ruleset = yaml.safe_load(f)
+    return sorted({
+        keyword
+        for families in ruleset["keyword_families"].values()
+        for keywords in families.values()
+        for keyword in keywords
+    })
+
+
+def generate_corpus(size, seed=CORPUS_SEED):
+    """Lazily generate `size` synthetic policy documents with a realistic length distribution
+
+    Body length is log-normal (median ~600 words, long tail into full regulation
+    texts of tens of thousands of words); roughly 3% of words are ruleset keywords.
+    Documents are yielded one at a time so the 100k corpus never sits in memory.
+    """
+    rng = random.Random(seed)
+    vocabulary = load_vocabulary()
+    for i in range(size):
+        n_words = min(int(rng.lognormvariate(math.log(600), 1.1)) + 20, 60000)
+        words = [
+            rng.choice(vocabulary) if rng.random() < 0.03 else rng.choice(FILLER_WORDS)
+            for _ in range(n_words)
+        ]
+        yield {
+            "title": f"Synthetic Policy {i} on {rng.choice(vocabulary)}",
+            "summary": " ".join(rng.choice(FILLER_WORDS + vocabulary) for _ in range(rng.randint(20, 80))),
+            "text": " ".join(words),
+            "jurisdiction": rng.choice(["EU", "US-Federal", "US-CA", "UK", "OTHER"]),
+            "source": rng.choice(["European Commission", "U.S. SEC", "California OAL", "UK Government"]),
+            "effective_date": date(2025, 10, 15) + timedelta(days=rng.randint(-365, 1500)),
+        }
+
+
+def measure_calls(func, items):
+    """Call func once per item and return throughput and latency percentiles
+
+    Only time spent inside func counts, so lazy corpus generation is excluded.
+    """
+    latencies = []
+    for item in items:
+        call_start = time.perf_counter_ns()
+        func(item)
+        latencies.append(time.perf_counter_ns() - call_start)
+    elapsed = sum(latencies) / 1e9
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] / 1000.0
+
+    return {
+        "documents": len(latencies),
+        "throughput_per_s": len(latencies) / elapsed if elapsed else float("inf"),
+        "p50_us": percentile(50),
+        "p99_us": percentile(99),
+    }
+
+
+@pytest.fixture
+def measure():
+    """Per-call timing helper"""
+    return measure_calls
+
+
+@pytest.fixture
+def corpus_factory():
+    """Build synthetic corpora by size (same documents on every call)"""
+    return generate_corpus
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Collect results for the session and write them as JSON at the end
+
+    Updating the baseline merges into the committed file, so a partial run
+    (e.g. without slow benchmarks) keeps the entries it did not measure.
+    """
+    results = {}
+    yield results
+    if results:
+        output = Path(os.getenv("BENCHMARK_OUTPUT", BENCHMARK_OUTPUT))
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        if os.getenv("BENCHMARK_UPDATE_BASELINE") == "1":
+            with open(BENCHMARK_BASELINE, "r") as f:
+                baseline = json.load(f)
+            baseline.update(results)
+            with open(BENCHMARK_BASELINE, "w") as f:
+                json.dump(baseline, f, indent=2, sort_keys=True)
+                f.write("\n")
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline():
+    """Load committed baseline results (empty entries mean no baseline recorded yet)"""
+    with open(BENCHMARK_BASELINE, "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def check_regression(benchmark_baseline):
+    """Fail when a result regresses past the threshold relative to the committed baseline"""
+    threshold = float(os.getenv("BENCHMARK_REGRESSION_THRESHOLD", "0.25"))
+
+    def check(name, result):
+        baseline = benchmark_baseline.get(name)
+        if not baseline:
+            return
+        min_throughput = baseline["throughput_per_s"] * (1 - threshold)
+        max_p99 = baseline["p99_us"] * (1 + threshold)
+        assert result["throughput_per_s"] >= min_throughput, \
+            f"{name}: throughput {result['throughput_per_s']:.0f}/s regressed below {min_throughput:.0f}/s " \
+            f"(baseline {baseline['throughput_per_s']:.0f}/s, threshold {threshold:.0%})"
+        assert result["p99_us"] <= max_p99, \
+            f"{name}: p99 latency {result['p99_us']:.0f}us regressed above {max_p99:.0f}us " \
+            f"(baseline {baseline['p99_us']:.0f}us, threshold {threshold:.0%})"
+
+    return check
@@ -0,0 +1,89 @@
+"""
+Performance benchmarks for the classification and scoring hot paths
+"""
+import pytest
+
+
+@pytest.mark.performance
+class TestCoreBenchmarks:
+    """Benchmark classify_policy and calculate_impact_score on synthetic corpora"""
+
+    @pytest.fixture
+    def core(self):
+        """Import classification and scoring functions
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core.classify import classify_policy
+            from app.core.scoring import calculate_impact_score
+        except ImportError:
+            try:
+                from backend.app.core.classify import classify_policy
+                from backend.app.core.scoring import calculate_impact_score
+            except ImportError:
+                pytest.skip("Backend core modules not available - skipping benchmarks")
+        return classify_policy, calculate_impact_score
+
+    @pytest.mark.parametrize("size", [
+        1_000,
+        10_000,
+        pytest.param(100_000, marks=pytest.mark.slow),
+    ])
+    def test_classify_policy_throughput(self, core, corpus_factory, benchmark_results, check_regression, measure, size):
+        """Benchmark classify_policy per-call latency and throughput"""
+        classify_policy, _ = core
+        corpus = corpus_factory(size)
+
+        result = measure(
+            lambda doc: classify_policy(
+                title=doc["title"],
+                text=doc["text"],
+                jurisdiction=doc["jurisdiction"],
+                source=doc["source"],
+                summary=doc["summary"],
+                effective_date=doc["effective_date"],
+            ),
+            corpus,
+        )
+
+        name = f"classify_policy[{size}]"
+        benchmark_results[name] = result
+        check_regression(name, result)
+
+    @pytest.mark.parametrize("size", [
+        1_000,
+        10_000,
+        pytest.param(100_000, marks=pytest.mark.slow),
+    ])
+    def test_calculate_impact_score_throughput(
+        self, core, corpus_factory, benchmark_results, check_regression, measure, frozen_datetime, size
+    ):
+        """Benchmark calculate_impact_score per-call latency and throughput"""
+        _, calculate_impact_score = core
+        corpus = corpus_factory(size)
+
+        result = measure(
+            lambda doc: calculate_impact_score(
+                mandatory=True,
+                effective_date=doc["effective_date"],
+                scopes=[1, 2],
+                sectors=["energy", "manufacturing"],
+                title=doc["title"],
+                summary=doc["summary"],
+                text=doc["text"],
+            ),
+            corpus,
+        )
+
+        name = f"calculate_impact_score[{size}]"
+        benchmark_results[name] = result
+        check_regression(name, result)
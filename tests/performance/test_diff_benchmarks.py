@@ -0,0 +1,64 @@
+"""
+Performance benchmarks for the version-bump diff engine on large documents
+"""
+import pytest
+
+
+def revisions(size_bytes, edits, count=20):
+    """`count` (old, new) pairs of ~size_bytes texts, each new text with `edits` rewritten lines"""
+    lines = size_bytes // 80
+    base = [f"Article {i}. Large undertakings shall disclose scope {i % 3 + 1} emissions annually." for i in range(lines)]
+    for n in range(count):
+        new = list(base)
+        for e in range(edits):
+            index = (n * 7919 + e * 104729) % lines
+            new[index] = f"Article {index}. Amended in revision {n}: all undertakings shall report."
+        yield "\n".join(base), "\n".join(new)
+
+
+@pytest.mark.performance
+class TestDiffBenchmarks:
+    """Benchmark diff_fields on 1 MB and larger policy texts"""
+
+    @pytest.fixture
+    def diff_fields(self):
+        """Import the diff engine
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core.diff import diff_fields
+        except ImportError:
+            try:
+                from backend.app.core.diff import diff_fields
+            except ImportError:
+                pytest.skip("Backend diff module not available - skipping benchmarks")
+        return diff_fields
+
+    @pytest.mark.parametrize("size_bytes, edits", [
+        (1_000_000, 1),
+        (1_000_000, 100),
+        pytest.param(8_000_000, 100, marks=pytest.mark.slow),
+    ])
+    def test_diff_fields_large_documents(
+        self, diff_fields, benchmark_results, check_regression, measure, size_bytes, edits
+    ):
+        """Benchmark diff_fields per-call latency on large revised texts"""
+        result = measure(
+            lambda pair: diff_fields({"text": pair[0]}, {"text": pair[1]}),
+            revisions(size_bytes, edits),
+        )
+
+        name = f"diff_fields[{size_bytes // 1_000_000}MB-{edits}edits]"
+        benchmark_results[name] = result
+        check_regression(name, result)
+        assert result["p99_us"] < 1_000_000, \
+            f"{name}: p99 {result['p99_us'] / 1000:.0f}ms exceeds the 1s diff budget"
@@ -0,0 +1,132 @@
+"""
+Unit tests for the shared DocumentAnalysis value consumed by classification and scoring
+"""
+import pytest
+import json
+from datetime import date
+from unittest.mock import patch
+
+
+@pytest.mark.unit
+@pytest.mark.golden
+class TestDocumentAnalysis:
+    """Test that one DocumentAnalysis per item gives the same results as raw strings"""
+
+    @pytest.fixture
+    def core(self):
+        """Import analysis, classification and scoring modules
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import analysis, classify, scoring
+        except ImportError:
+            try:
+                from backend.app.core import analysis, classify, scoring
+            except ImportError:
+                pytest.skip("Backend analysis module not available - skipping DocumentAnalysis tests")
+        return analysis, classify, scoring
+
+    @pytest.fixture
+    def classification_cases(self, golden_dir):
+        """Load golden classification test cases"""
+        with open(golden_dir / "classification_cases.json", "r") as f:
+            return json.load(f)
+
+    def test_classify_with_analysis_matches_raw_strings(self, core, classification_cases):
+        """Test: classify_policy(analysis=...) equals classify_policy on raw strings"""
+        analysis, classify, _ = core
+
+        for case in classification_cases:
+            input_data = case["input"]
+            raw = classify.classify_policy(
+                title=input_data["title"],
+                text=input_data["text"],
+                jurisdiction=input_data.get("jurisdiction", "OTHER"),
+                source=input_data.get("source", ""),
+                summary=input_data.get("summary", ""),
+            )
+            doc = analysis.DocumentAnalysis.from_fields(
+                title=input_data["title"],
+                summary=input_data.get("summary", ""),
+                text=input_data["text"],
+            )
+            shared = classify.classify_policy(
+                analysis=doc,
+                jurisdiction=input_data.get("jurisdiction", "OTHER"),
+                source=input_data.get("source", ""),
+            )
+
+            assert shared == raw, f"Case {case['id']}: DocumentAnalysis result differs from raw-string result"
+
+    def test_score_with_analysis_matches_raw_strings(self, core, frozen_datetime):
+        """Test: calculate_impact_score(analysis=...) equals scoring on raw strings"""
+        analysis, _, scoring = core
+        fields = {
+            "title": "Test Policy",
+            "summary": "Supplier emissions disclosure",
+            "text": "supplier-level granular itemized data with assurance and audit",
+        }
+        common = {
+            "mandatory": True,
+            "effective_date": date(2026, 1, 1),
+            "scopes": [1, 2, 3],
+            "sectors": ["energy", "manufacturing"],
+        }
+
+        raw = scoring.calculate_impact_score(**common, **fields)
+        shared = scoring.calculate_impact_score(**common, analysis=analysis.DocumentAnalysis.from_fields(**fields))
+
+        assert shared == raw, f"DocumentAnalysis score {shared} differs from raw-string score {raw}"
+
+    def test_document_scanned_once_for_classify_and_score(self, core, frozen_datetime):
+        """Test: building the analysis scans the text once; classify and score reuse its hits"""
+        analysis, classify, scoring = core
+        matcher = classify.KEYWORD_MATCHER
+
+        with patch.object(matcher, "count", wraps=matcher.count) as spy:
+            doc = analysis.DocumentAnalysis.from_fields(
+                title="EU ESRS Update",
+                summary="Value-chain data",
+                text="Companies must disclose supplier emissions with third-party assurance.",
+            )
+            result = classify.classify_policy(analysis=doc, jurisdiction="EU", source="European Commission")
+            scoring.calculate_impact_score(
+                mandatory=result["mandatory"],
+                effective_date=date(2026, 1, 1),
+                scopes=result["scopes"],
+                sectors=[],
+                analysis=doc,
+            )
+
+        assert spy.call_count == 1, f"Document should be scanned once, scanned {spy.call_count} times"
+
+    def test_token_offsets_index_normalized_text(self, core):
+        """Test: token offsets are (start, end) spans into normalized_text"""
+        analysis, _, _ = core
+
+        doc = analysis.DocumentAnalysis.from_fields(
+            title="Carbon Tax", summary="", text="Shall apply to ALL sectors."
+        )
+        tokens = [doc.normalized_text[start:end] for start, end in doc.token_offsets]
+
+        assert doc.normalized_text == doc.normalized_text.lower(), "normalized_text should be lowercased"
+        assert tokens[:2] == ["carbon", "tax"], f"Unexpected leading tokens: {tokens[:2]}"
+        assert "shall" in tokens and "sectors" in tokens, f"Unexpected tokens: {tokens}"
+
+    def test_analysis_is_immutable(self, core):
+        """Test: DocumentAnalysis is a value object and cannot be mutated after construction"""
+        analysis, _, _ = core
+
+        doc = analysis.DocumentAnalysis.from_fields(title="Test", summary="", text="mandatory")
+
+        with pytest.raises(AttributeError):
+            doc.normalized_text = "changed"
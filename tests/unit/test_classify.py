@@ -240,3 +240,234 @@ class TestClassification:
         assert result1 == result2, \
             "Classification should be deterministic (same input → same output)"
 
+
+@pytest.mark.unit
+@pytest.mark.golden
+class TestBatchClassification:
+    """Test batch classification against single-item classify_policy"""
+
+    @pytest.fixture
+    def classification_cases(self, golden_dir):
+        """Load golden classification test cases"""
+        cases_file = golden_dir / "classification_cases.json"
+        with open(cases_file, "r") as f:
+            return json.load(f)
+
+    @pytest.fixture
+    def classify_module(self):
+        """Import classification module
+        
+        This will use the actual implementation when available.
+        """
+        import sys
+        
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+        
+        try:
+            from app.core import classify
+        except ImportError:
+            try:
+                from backend.app.core import classify
+            except ImportError:
+                pytest.skip("Backend classification module not available - skipping batch tests")
+        if not hasattr(classify, "classify_policies"):
+            pytest.skip("classify_policies not available - skipping batch tests")
+        return classify
+
+    @pytest.fixture
+    def records(self, classification_cases):
+        """Golden inputs as (title, text, jurisdiction, source, summary, effective_date) records
+
+        Each golden input appears undated and with an effective date given as an
+        ISO date string, an ISO datetime string and a date object, so the date
+        part of the batch output is compared too.
+        """
+        effective_dates = [None, "2026-01-01", "2027-06-30T00:00:00", date(2025, 12, 1)]
+        return [
+            (
+                case["input"]["title"],
+                case["input"]["text"],
+                case["input"].get("jurisdiction", "OTHER"),
+                case["input"].get("source", ""),
+                case["input"].get("summary", ""),
+                effective_date,
+            )
+            for case in classification_cases
+            for effective_date in effective_dates
+        ]
+
+    def test_batch_matches_single_item_in_input_order(self, classify_module, records):
+        """Test: classify_policies returns classify_policy results in input order"""
+        expected = [
+            classify_module.classify_policy(
+                title=title, text=text, jurisdiction=jurisdiction,
+                source=source, summary=summary, effective_date=effective_date,
+            )
+            for title, text, jurisdiction, source, summary, effective_date in records
+        ]
+        
+        # Reverse the input as well so order cannot come from the golden file by accident
+        results = classify_module.classify_policies(records, workers=2)
+        reversed_results = classify_module.classify_policies(list(reversed(records)), workers=2)
+        
+        assert results == expected, "Batch results should equal classify_policy results in input order"
+        assert reversed_results == list(reversed(expected)), \
+            "Batch results should follow input order, not completion order"
+
+    def test_batch_deterministic_across_worker_counts(self, classify_module, records):
+        """Test: results do not depend on the number of workers or chunking"""
+        # Repeat the golden records so several chunks are dispatched
+        many = records * 20
+        
+        serial = classify_module.classify_policies(many, workers=1)
+        parallel = classify_module.classify_policies(many, workers=4)
+        
+        assert serial == parallel, "Batch classification should be deterministic across worker counts"
+
+    def test_batch_accepts_iterables(self, classify_module, records):
+        """Test: classify_policies accepts any iterable, including generators"""
+        results = classify_module.classify_policies((record for record in records), workers=2)
+        
+        assert len(results) == len(records), \
+            f"Expected {len(records)} results, got {len(results)}"
+
+    def test_batch_empty_input(self, classify_module):
+        """Test: empty input returns an empty list without starting workers"""
+        assert classify_module.classify_policies([], workers=4) == []
+
+
+@pytest.mark.unit
+@pytest.mark.golden
+class TestStreamingClassification:
+    """Test bounded-memory streaming classification against classify_policy"""
+
+    @pytest.fixture
+    def classification_cases(self, golden_dir):
+        """Load golden classification test cases"""
+        cases_file = golden_dir / "classification_cases.json"
+        with open(cases_file, "r") as f:
+            return json.load(f)
+
+    @pytest.fixture
+    def classify_module(self):
+        """Import classification module
+        
+        This will use the actual implementation when available.
+        """
+        import sys
+        
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+        
+        try:
+            from app.core import classify
+        except ImportError:
+            try:
+                from backend.app.core import classify
+            except ImportError:
+                pytest.skip("Backend classification module not available - skipping streaming tests")
+        if not hasattr(classify, "classify_policy_stream"):
+            pytest.skip("classify_policy_stream not available - skipping streaming tests")
+        return classify
+
+    @staticmethod
+    def chunked(text, size):
+        """Yield text in fixed-size chunks"""
+        for start in range(0, len(text), size):
+            yield text[start:start + size]
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096])
+    def test_stream_matches_non_streaming(self, classify_module, classification_cases, chunk_size):
+        """Test: streaming result equals classify_policy for every golden case and chunk size"""
+        for case in classification_cases:
+            input_data = case["input"]
+            kwargs = {
+                "title": input_data["title"],
+                "jurisdiction": input_data.get("jurisdiction", "OTHER"),
+                "source": input_data.get("source", ""),
+                "summary": input_data.get("summary", ""),
+            }
+            
+            expected = classify_module.classify_policy(text=input_data["text"], **kwargs)
+            result = classify_module.classify_policy_stream(
+                self.chunked(input_data["text"], chunk_size), **kwargs
+            )
+            
+            assert result == expected, \
+                f"Case {case['id']}: streaming result differs at chunk_size={chunk_size}"
+
+    def test_stream_stops_once_all_families_saturated(self, classify_module):
+        """Test: chunks after every keyword family is saturated are not consumed"""
+        keywords = sorted({kw for family in classify_module.KEYWORD_FAMILIES.values() for kw in family})
+        prefix = " ".join(keywords * classify_module.SATURATION_HITS) + " "
+        filler = "lorem ipsum dolor sit amet " * 40
+        total_chunks = 1000
+        consumed = []
+        
+        def chunks():
+            yield prefix
+            for i in range(total_chunks):
+                consumed.append(i)
+                yield filler
+        
+        result = classify_module.classify_policy_stream(
+            chunks(), title="Saturated Policy", jurisdiction="EU", source="European Commission"
+        )
+        expected = classify_module.classify_policy(
+            title="Saturated Policy", text=prefix + filler * total_chunks,
+            jurisdiction="EU", source="European Commission",
+        )
+        
+        assert result == expected, "Early stop must not change the classification"
+        assert len(consumed) < total_chunks, \
+            f"Stream should stop early once saturated, consumed {len(consumed)} of {total_chunks} filler chunks"
+
+    def test_hits_beyond_saturation_do_not_change_result(self, classify_module):
+        """Test: counts are capped at SATURATION_HITS, so a family overtaking another past the cap changes nothing"""
+        families = classify_module.KEYWORD_FAMILIES
+        keywords = sorted({kw for family in families.values() for kw in family})
+        prefix = " ".join(keywords * classify_module.SATURATION_HITS) + " "
+        kwargs = {"title": "Saturated Policy", "jurisdiction": "EU", "source": "European Commission"}
+        saturated = classify_module.classify_policy(text=prefix, **kwargs)
+        
+        for name, family_keywords in sorted(families.items()):
+            # Only this family keeps gaining hits after every family is saturated
+            overtake = (family_keywords[0] + " ") * (classify_module.SATURATION_HITS * 10)
+            text = prefix + overtake
+            
+            full = classify_module.classify_policy(text=text, **kwargs)
+            streamed = classify_module.classify_policy_stream(self.chunked(text, 64), **kwargs)
+            
+            assert full == saturated, \
+                f"Extra '{name}' hits past SATURATION_HITS changed the classification"
+            assert streamed == full, f"Streaming differs from classify_policy when '{name}' overtakes"
+
+    @pytest.mark.slow
+    def test_stream_peak_memory_flat_in_document_size(self, classify_module):
+        """Test: peak allocations do not grow with document size when streaming"""
+        import tracemalloc
+        
+        # Filler without keywords so the stream cannot stop early
+        chunk = "lorem ipsum dolor sit amet consectetur " * 1600  # ~64 KB
+        
+        def peak_for(n_chunks):
+            tracemalloc.start()
+            try:
+                classify_module.classify_policy_stream(
+                    (chunk for _ in range(n_chunks)),
+                    title="Large Regulation", jurisdiction="EU", source="European Commission",
+                )
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        
+        small = peak_for(16)   # ~1 MB
+        large = peak_for(128)  # ~8 MB
+        
+        assert large < small * 2, \
+            f"Peak memory should stay flat: ~1 MB doc peaked at {small} bytes, ~8 MB doc at {large} bytes"
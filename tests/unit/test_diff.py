@@ -0,0 +1,111 @@
+"""
+Unit tests for the bounded, field-aware diff engine used on version bumps
+"""
+import pytest
+import time
+from unittest.mock import patch
+
+
+def long_text(lines, revision=0):
+    """Multi-line policy text; `revision` rewrites one line in the middle"""
+    return "\n".join(
+        f"Article {i}. Large undertakings shall disclose scope {i % 3 + 1} emissions"
+        + (f" (amended in revision {revision})" if i == lines // 2 and revision else "")
+        for i in range(lines)
+    )
+
+
+@pytest.mark.unit
+class TestFieldDiff:
+    """Test per-field hash comparison, line diffs and the budget fallback"""
+
+    @pytest.fixture
+    def diff(self):
+        """Import diff module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import diff
+            return diff
+        except ImportError:
+            try:
+                from backend.app.core import diff
+                return diff
+            except ImportError:
+                pytest.skip("Backend diff module not available - skipping diff engine tests")
+
+    def test_unchanged_fields_omitted_without_text_diff(self, diff):
+        """Test: fields with equal hashes are skipped before any textual diff runs"""
+        old = {"title": "Policy", "summary": "Summary", "text": long_text(2000)}
+        new = {"title": "Policy", "summary": "Summary", "text": long_text(2000)}
+
+        with patch.object(diff, "diff_text", wraps=diff.diff_text) as text_spy:
+            result = diff.diff_fields(old, new)
+
+        assert result == {}, f"Identical fields should produce an empty diff, got {result}"
+        assert text_spy.call_count == 0, "No textual diff should run for unchanged fields"
+
+    def test_short_fields_keep_old_new(self, diff):
+        """Test: short changed fields use the existing {"old", "new"} diff shape"""
+        result = diff.diff_fields(
+            {"title": "Original Title", "summary": "Same"},
+            {"title": "Modified Title", "summary": "Same"},
+        )
+
+        assert result == {"title": {"old": "Original Title", "new": "Modified Title"}}
+
+    def test_long_field_gets_line_hunks(self, diff):
+        """Test: a long changed field is diffed line by line and only the changed line is reported"""
+        old, new = long_text(2000), long_text(2000, revision=1)
+
+        result = diff.diff_fields({"text": old}, {"text": new})["text"]
+
+        assert result["truncated"] is False
+        assert result["lines_added"] == 1 and result["lines_removed"] == 1, \
+            f"One rewritten line expected, got +{result['lines_added']} -{result['lines_removed']}"
+        assert any("amended in revision 1" in line for hunk in result["hunks"] for line in hunk["added"])
+        assert "old" not in result and "new" not in result, "Long fields should not be copied whole"
+
+    def test_time_budget_falls_back_to_summary(self, diff):
+        """Test: a worst-case diff stops at the time budget and returns a summary diff"""
+        # Every line differs, the quadratic worst case for a line diff
+        old = "\n".join(f"old line {i} " + "x" * 40 for i in range(40_000))
+        new = "\n".join(f"new line {i} " + "y" * 40 for i in range(40_000))
+
+        started = time.monotonic()
+        result = diff.diff_fields({"text": old}, {"text": new}, time_budget=0.2)["text"]
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 1.0, f"Diff should respect its 0.2s budget, took {elapsed:.2f}s"
+        assert result["truncated"] is True
+        assert result["old_length"] == len(old) and result["new_length"] == len(new)
+        assert result["old_hash"] != result["new_hash"]
+
+    def test_size_budget_caps_output(self, diff):
+        """Test: diff output beyond size_budget is cut off and marked truncated"""
+        old = "\n".join(f"line {i}" for i in range(5000))
+        new = "\n".join(f"line {i} changed" if i % 2 else f"line {i}" for i in range(5000))
+
+        result = diff.diff_fields({"text": old}, {"text": new}, size_budget=4096)["text"]
+
+        assert result["truncated"] is True
+        assert sum(len(line) for hunk in result.get("hunks", []) for line in hunk["added"] + hunk["removed"]) <= 4096
+
+    def test_field_hashes_are_stable(self, diff):
+        """Test: field_hashes gives one stable digest per field"""
+        fields = {"title": "Policy", "text": long_text(10)}
+
+        hashes = diff.field_hashes(fields)
+
+        assert set(hashes) == {"title", "text"}
+        assert hashes == diff.field_hashes(dict(fields))
+        assert hashes["text"] != diff.field_hashes({"text": long_text(10, revision=1)})["text"]
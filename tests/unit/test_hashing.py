@@ -0,0 +1,116 @@
+"""
+Unit tests for the single-pass normalization and dual-hash engine used by ingest
+"""
+import pytest
+import tracemalloc
+
+
+@pytest.mark.unit
+class TestDualHash:
+    """Test that content_hash and normalized_hash come from one streaming pass"""
+
+    @pytest.fixture
+    def hashing(self):
+        """Import hashing module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import hashing
+            return hashing
+        except ImportError:
+            try:
+                from backend.app.core import hashing
+                return hashing
+            except ImportError:
+                pytest.skip("Backend hashing module not available - skipping dual-hash tests")
+
+    @pytest.fixture
+    def item(self):
+        """Fixed raw item"""
+        return {
+            "source_item_id": "test-1",
+            "title_raw": "Test Policy 1",
+            "summary_raw": "This is a test policy summary",
+            "text_raw": "This is a test policy text with mandatory requirements",
+            "effective_date_raw": "2026-01-01",
+        }
+
+    def test_hash_item_returns_both_digests_and_version(self, hashing, item):
+        """Test: hash_item returns content_hash, normalized_hash and the algorithm version"""
+        hashes = hashing.hash_item(item)
+
+        assert isinstance(hashes.content_hash, str) and hashes.content_hash
+        assert isinstance(hashes.normalized_hash, str) and hashes.normalized_hash
+        assert hashes.content_hash != hashes.normalized_hash
+        assert hashes.algorithm_version == hashing.HASH_ALGORITHM_VERSION
+        assert isinstance(hashing.HASH_ALGORITHM_VERSION, int)
+
+    def test_deterministic(self, hashing, item):
+        """Test: same item → same digests"""
+        assert hashing.hash_item(item) == hashing.hash_item(dict(item))
+
+    def test_formatting_changes_only_content_hash(self, hashing, item):
+        """Test: case and whitespace changes alter content_hash but not normalized_hash"""
+        reformatted = {
+            **item,
+            "title_raw": "  TEST   Policy 1 ",
+            "text_raw": "This is a test\n\npolicy text with   mandatory requirements",
+        }
+        original, changed = hashing.hash_item(item), hashing.hash_item(reformatted)
+
+        assert changed.content_hash != original.content_hash
+        assert changed.normalized_hash == original.normalized_hash
+
+    def test_wording_change_alters_both_hashes(self, hashing, item):
+        """Test: a substantive change alters both digests"""
+        amended = {**item, "text_raw": "This is a test policy text with voluntary requirements"}
+        original, changed = hashing.hash_item(item), hashing.hash_item(amended)
+
+        assert changed.content_hash != original.content_hash
+        assert changed.normalized_hash != original.normalized_hash
+
+    def test_field_boundaries_are_hashed(self, hashing, item):
+        """Test: moving text across a field boundary is a change"""
+        shifted = {**item, "title_raw": "Test Policy 1 This", "summary_raw": "is a test policy summary"}
+
+        assert hashing.hash_item(shifted).content_hash != hashing.hash_item(item).content_hash
+        assert hashing.hash_item(shifted).normalized_hash != hashing.hash_item(item).normalized_hash
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+    def test_streaming_matches_whole_fields(self, hashing, item, chunk_size):
+        """Test: feeding fields in arbitrary chunks gives the same digests as hash_item"""
+        item = {**item, "text_raw": "Mandatory   disclosure\t\n of  SCOPE 3 emissions. " * 50}
+        hasher = hashing.DualHasher()
+        for field in hashing.HASHED_FIELDS:
+            value = item.get(field) or ""
+            hasher.begin_field(field)
+            for start in range(0, len(value), chunk_size):
+                hasher.update(value[start:start + chunk_size])
+
+        assert hasher.result() == hashing.hash_item(item), \
+            f"Chunk size {chunk_size} should not change the digests"
+
+    @pytest.mark.slow
+    def test_large_document_not_copied(self, hashing, item):
+        """Test: hashing a large text allocates far less than one extra copy of it"""
+        text = "Mandatory disclosure of scope 3 emissions applies to large companies. " * 150_000
+        large = {**item, "text_raw": text}
+
+        tracemalloc.start()
+        try:
+            hashing.hash_item(large)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < len(text) // 2, \
+            f"Peak allocation {peak} bytes for a {len(text)}-char text suggests full-size copies"
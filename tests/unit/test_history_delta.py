@@ -0,0 +1,81 @@
+"""
+Unit tests for the delta encoding behind compressed policy version history
+"""
+import pytest
+
+
+@pytest.mark.unit
+class TestHistoryDelta:
+    """Test that deltas round-trip exactly and stay small for small edits"""
+
+    @pytest.fixture
+    def history(self):
+        """Import history module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import history
+            return history
+        except ImportError:
+            try:
+                from backend.app.core import history
+                return history
+            except ImportError:
+                pytest.skip("Backend history module not available - skipping delta tests")
+
+    @pytest.fixture
+    def long_text(self):
+        """~100 KB policy text"""
+        return "".join(
+            f"Article {i}. Large undertakings shall disclose scope {i % 3 + 1} emissions annually.\n"
+            for i in range(1500)
+        )
+
+    @pytest.mark.parametrize("old, new", [
+        ("", ""),
+        ("", "New summary"),
+        ("Old summary", ""),
+        ("Original text with mandatory requirements", "Modified text with mandatory requirements"),
+        ("Émissions — portée 3", "Émissions — portée 1, 2 et 3 ✓"),
+    ])
+    def test_round_trip(self, history, old, new):
+        """Test: apply_delta(old, encode_delta(old, new)) == new"""
+        delta = history.encode_delta(old, new)
+
+        assert isinstance(delta, bytes)
+        assert history.apply_delta(old, delta) == new
+
+    def test_small_edit_gives_small_delta(self, history, long_text):
+        """Test: a one-line amendment to a long text costs a small fraction of the text"""
+        amended = long_text.replace("Article 700. Large undertakings", "Article 700. All undertakings")
+        delta = history.encode_delta(long_text, amended)
+
+        assert history.apply_delta(long_text, delta) == amended
+        assert len(delta) < len(long_text.encode("utf-8")) * 0.02, \
+            f"Delta of {len(delta)} bytes is too large for a one-line change"
+
+    def test_snapshot_round_trip_is_compressed(self, history, long_text):
+        """Test: snapshots are compressed and restore the exact fields"""
+        fields = {"title": "Emissions Directive", "summary": "Summary", "text": long_text}
+        snapshot = history.encode_snapshot(fields)
+
+        assert history.decode_snapshot(snapshot) == fields
+        assert len(snapshot) < len(long_text.encode("utf-8")) / 4, "Repetitive policy text should compress well"
+
+    def test_snapshot_interval(self, history):
+        """Test: a full snapshot is kept for every SNAPSHOT_INTERVAL-th version"""
+        interval = history.SNAPSHOT_INTERVAL
+
+        assert interval > 1
+        assert history.is_snapshot_version(interval)
+        assert history.is_snapshot_version(2 * interval)
+        assert not any(history.is_snapshot_version(v) for v in range(1, interval))
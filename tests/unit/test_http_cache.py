@@ -0,0 +1,165 @@
+"""
+Unit tests for the conditional-request HTTP cache used by source fetchers
+"""
+import pytest
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubSourceHandler(BaseHTTPRequestHandler):
+    """Serves /page/<n> with ETag and Last-Modified, answering 304 to matching conditional requests"""
+
+    pages = {}
+    log = []
+    last_modified = formatdate(1760529600, usegmt=True)  # 2025-10-15 12:00:00 GMT
+
+    def do_GET(self):
+        body = self.pages.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:16]
+        conditional = self.headers.get("If-None-Match") or self.headers.get("If-Modified-Since")
+        self.log.append((self.path, conditional))
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.last_modified)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+@pytest.mark.unit
+class TestHttpCache:
+    """Test ETag/Last-Modified caching against a local stub server"""
+
+    @pytest.fixture
+    def httpcache(self):
+        """Import HTTP cache module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.ingest import httpcache
+            return httpcache
+        except ImportError:
+            try:
+                from backend.app.ingest import httpcache
+                return httpcache
+            except ImportError:
+                pytest.skip("Backend HTTP cache not available - skipping HTTP cache tests")
+
+    @pytest.fixture
+    def stub_server(self):
+        """Run the stub source on an ephemeral local port"""
+        StubSourceHandler.pages = {
+            "/page/1": b'{"items": [{"source_item_id": "a"}]}',
+            "/page/2": b'{"items": [{"source_item_id": "b"}]}',
+            "/page/3": b'{"items": [{"source_item_id": "c"}]}',
+        }
+        StubSourceHandler.log = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubSourceHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @pytest.fixture
+    def httpx(self):
+        """httpx is the fetchers' HTTP client"""
+        return pytest.importorskip("httpx")
+
+    @pytest.mark.asyncio
+    async def test_second_fetch_sends_conditional_request(self, httpcache, httpx, stub_server, tmp_path):
+        """Test: a cached URL is revalidated with If-None-Match and a 304 short-circuits to 'no changes'"""
+        cache = httpcache.HttpCache(tmp_path, max_bytes=1_000_000)
+        url = f"{stub_server}/page/1"
+
+        async with httpx.AsyncClient() as client:
+            first = await httpcache.conditional_get(client, url, cache)
+            second = await httpcache.conditional_get(client, url, cache)
+
+        assert first.not_modified is False
+        assert first.content == StubSourceHandler.pages["/page/1"]
+        assert second.not_modified is True, "Unchanged page should be reported as not modified"
+        assert second.content is None, "A 304 should not hand content on for parsing or hashing"
+        assert StubSourceHandler.log[0] == ("/page/1", None), "First request should be unconditional"
+        assert StubSourceHandler.log[1][1] is not None, "Second request should carry a validator"
+
+    @pytest.mark.asyncio
+    async def test_changed_page_returns_new_content(self, httpcache, httpx, stub_server, tmp_path):
+        """Test: when the ETag changes the new body is returned and cached"""
+        cache = httpcache.HttpCache(tmp_path, max_bytes=1_000_000)
+        url = f"{stub_server}/page/2"
+
+        async with httpx.AsyncClient() as client:
+            await httpcache.conditional_get(client, url, cache)
+            StubSourceHandler.pages["/page/2"] = b'{"items": [{"source_item_id": "b", "v": 2}]}'
+            changed = await httpcache.conditional_get(client, url, cache)
+            again = await httpcache.conditional_get(client, url, cache)
+
+        assert changed.not_modified is False
+        assert changed.content == StubSourceHandler.pages["/page/2"]
+        assert again.not_modified is True, "New ETag should be stored after a 200"
+
+    @pytest.mark.asyncio
+    async def test_validators_persist_on_disk(self, httpcache, httpx, stub_server, tmp_path):
+        """Test: a new cache instance on the same directory reuses stored validators"""
+        url = f"{stub_server}/page/1"
+
+        async with httpx.AsyncClient() as client:
+            await httpcache.conditional_get(client, url, httpcache.HttpCache(tmp_path, max_bytes=1_000_000))
+            reopened = await httpcache.conditional_get(
+                client, url, httpcache.HttpCache(tmp_path, max_bytes=1_000_000)
+            )
+
+        assert reopened.not_modified is True, "Validators should survive process restarts"
+
+    @pytest.mark.asyncio
+    async def test_size_bounded_eviction(self, httpcache, httpx, stub_server, tmp_path):
+        """Test: the cache stays under max_bytes by evicting least recently used entries"""
+        async with httpx.AsyncClient() as client:
+            # Measure one entry, whatever the cache chooses to store for it
+            probe = httpcache.HttpCache(tmp_path / "probe", max_bytes=1_000_000)
+            await httpcache.conditional_get(client, f"{stub_server}/page/1", probe)
+            entry_size = probe.size_bytes()
+            assert entry_size > 0, "A cached entry should take space"
+
+            # Room for two entries but not three
+            max_bytes = entry_size * 2 + entry_size // 2
+            cache = httpcache.HttpCache(tmp_path / "bounded", max_bytes=max_bytes)
+            for n in (1, 2, 3):
+                await httpcache.conditional_get(client, f"{stub_server}/page/{n}", cache)
+            oldest = await httpcache.conditional_get(client, f"{stub_server}/page/1", cache)
+            newest = await httpcache.conditional_get(client, f"{stub_server}/page/3", cache)
+
+        assert cache.size_bytes() <= max_bytes, \
+            f"Cache size {cache.size_bytes()} should stay within max_bytes {max_bytes}"
+        assert oldest.not_modified is False, "Least recently used entry should have been evicted"
+        assert newest.not_modified is True, "Most recent entry should still be cached"
@@ -0,0 +1,184 @@
+"""
+Unit tests for the process-wide pooled HTTP client shared by fetchers
+
+Fetchers do not hold on to a client: `fetcher.client` looks up
+`get_http_client()` on every request, so a fetcher outlives a shutdown and
+reopen of the pool.
+"""
+import pytest
+import asyncio
+import importlib.util
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET over HTTP/1.1 keep-alive and records the client connection used"""
+
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    delay = 0.0
+
+    def do_GET(self):
+        with self.lock:
+            self.connections.add(self.client_address)
+            self.in_flight["now"] += 1
+            self.in_flight["peak"] = max(self.in_flight["peak"], self.in_flight["now"])
+        time.sleep(self.delay)
+        body = b'{"items": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with self.lock:
+            self.in_flight["now"] -= 1
+
+    def log_message(self, format, *args):
+        """Keep test output quiet"""
+
+
+@pytest.mark.unit
+class TestHttpClientPool:
+    """Test connection reuse, per-host limits, timeouts and shutdown of the shared client"""
+
+    @pytest.fixture
+    def http_client(self):
+        """Import HTTP client module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.ingest import http_client
+            return http_client
+        except ImportError:
+            try:
+                from backend.app.ingest import http_client
+                return http_client
+            except ImportError:
+                pytest.skip("Backend HTTP client pool not available - skipping HTTP client tests")
+
+    @pytest.fixture
+    def stub_server(self):
+        """Run a keep-alive stub source on an ephemeral local port"""
+        KeepAliveHandler.connections = set()
+        KeepAliveHandler.in_flight = {"now": 0, "peak": 0}
+        KeepAliveHandler.delay = 0.0
+        server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_address[1]}"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared(self, http_client):
+        """Test: every caller in the process gets the same client"""
+        try:
+            assert http_client.get_http_client() is http_client.get_http_client()
+        finally:
+            await http_client.aclose_http_client()
+
+    @pytest.mark.asyncio
+    async def test_paginated_requests_reuse_one_connection(self, http_client, stub_server):
+        """Test: sequential page fetches use a single kept-alive connection"""
+        try:
+            client = http_client.get_http_client()
+            for page in range(10):
+                response = await client.get(f"{stub_server}/page/{page}")
+                assert response.status_code == 200
+        finally:
+            await http_client.aclose_http_client()
+
+        assert len(KeepAliveHandler.connections) == 1, \
+            f"10 pages should share 1 connection, opened {len(KeepAliveHandler.connections)}"
+
+    @pytest.mark.asyncio
+    async def test_per_host_connection_limit(self, http_client, stub_server):
+        """Test: concurrent requests to one host never exceed MAX_CONNECTIONS_PER_HOST"""
+        KeepAliveHandler.delay = 0.05
+        try:
+            client = http_client.get_http_client()
+            await asyncio.gather(*(client.get(f"{stub_server}/page/{i}") for i in range(30)))
+        finally:
+            await http_client.aclose_http_client()
+
+        assert KeepAliveHandler.in_flight["peak"] <= http_client.MAX_CONNECTIONS_PER_HOST, \
+            f"Peak concurrent connections {KeepAliveHandler.in_flight['peak']} " \
+            f"exceeds {http_client.MAX_CONNECTIONS_PER_HOST}"
+
+    @pytest.mark.asyncio
+    async def test_timeouts_configured(self, http_client):
+        """Test: connect and read timeouts are finite"""
+        try:
+            timeout = http_client.get_http_client().timeout
+            assert timeout.connect is not None and timeout.connect > 0
+            assert timeout.read is not None and timeout.read > 0
+        finally:
+            await http_client.aclose_http_client()
+
+    def test_http2_enabled_when_available(self, http_client):
+        """Test: HTTP/2 is used when the h2 package is installed"""
+        assert http_client.HTTP2_ENABLED == (importlib.util.find_spec("h2") is not None)
+
+    @pytest.mark.asyncio
+    async def test_clean_shutdown(self, http_client):
+        """Test: shutdown closes the pooled client and a later call opens a fresh one"""
+        client = http_client.get_http_client()
+        await http_client.aclose_http_client()
+
+        assert client.is_closed, "Shutdown should close the pooled client"
+        reopened = http_client.get_http_client()
+        try:
+            assert reopened is not client and not reopened.is_closed
+        finally:
+            await http_client.aclose_http_client()
+
+    @pytest.mark.asyncio
+    async def test_fetchers_use_pooled_client(self, http_client):
+        """Test: fetchers from get_fetcher use the shared client instead of creating their own"""
+        try:
+            from app.ingest.fetchers import get_fetcher
+        except ImportError:
+            pytest.skip("Backend fetchers not available")
+
+        try:
+            cpdb = get_fetcher("cpdb")
+            usfr = get_fetcher("usfr")
+            assert cpdb.client is http_client.get_http_client()
+            assert usfr.client is cpdb.client, "Fetchers should share one pooled client"
+        finally:
+            await http_client.aclose_http_client()
+
+    @pytest.mark.asyncio
+    async def test_fetcher_follows_reopened_client(self, http_client):
+        """Test: a fetcher built before shutdown uses the new client after the pool is reopened"""
+        try:
+            from app.ingest.fetchers import get_fetcher
+        except ImportError:
+            pytest.skip("Backend fetchers not available")
+
+        cpdb = get_fetcher("cpdb")
+        original = cpdb.client
+        await http_client.aclose_http_client()
+
+        try:
+            reopened = http_client.get_http_client()
+            assert original.is_closed
+            assert cpdb.client is reopened, "Fetchers should look up the shared client at request time"
+            assert not cpdb.client.is_closed
+        finally:
+            await http_client.aclose_http_client()
@@ -0,0 +1,146 @@
+"""
+Unit tests for the compiled multi-pattern keyword matcher shared by classification families
+"""
+import pytest
+import json
+from unittest.mock import patch
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    """Test the single-pass keyword matcher against naive per-keyword scans"""
+
+    @pytest.fixture
+    def matcher_module(self):
+        """Import matcher module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import matcher
+            return matcher
+        except ImportError:
+            try:
+                from backend.app.core import matcher
+                return matcher
+            except ImportError:
+                pytest.skip("Backend matcher module not available - skipping matcher tests")
+
+    @pytest.fixture
+    def classify_module(self):
+        """Import classification module (needed for the shared KEYWORD_MATCHER)"""
+        try:
+            from app.core import classify
+            return classify
+        except ImportError:
+            try:
+                from backend.app.core import classify
+                return classify
+            except ImportError:
+                pytest.skip("Backend classification module not available - skipping matcher tests")
+
+    @staticmethod
+    def naive_counts(families, text):
+        """Reference implementation: count every (possibly overlapping) keyword occurrence"""
+        lowered = text.lower()
+        counts = {}
+        for family, keywords in families.items():
+            total = 0
+            for keyword in keywords:
+                start = lowered.find(keyword)
+                while start != -1:
+                    total += 1
+                    start = lowered.find(keyword, start + 1)
+            counts[family] = total
+        return counts
+
+    def test_counts_match_naive_scan(self, matcher_module):
+        """Test: per-family hit counts equal the sum of naive per-keyword scans"""
+        families = {
+            "mandatory": ["mandatory", "required", "must", "shall"],
+            "disclosure": ["disclosure", "report", "reporting", "data"],
+            "scope_3": ["supplier", "value chain", "value-chain"],
+        }
+        text = (
+            "Companies MUST report supplier data. Reporting is mandatory and "
+            "value-chain disclosure shall be required for every supplier."
+        )
+
+        matcher = matcher_module.KeywordMatcher(families)
+        result = matcher.count(text)
+
+        assert result == self.naive_counts(families, text), \
+            f"Matcher counts differ from naive scan: {result}"
+
+    def test_all_families_present_with_zero_hits(self, matcher_module):
+        """Test: families without hits are reported as 0, not omitted"""
+        families = {"ban": ["ban", "phase-out"], "pricing": ["carbon tax"]}
+
+        result = matcher_module.KeywordMatcher(families).count("nothing relevant here")
+
+        assert result == {"ban": 0, "pricing": 0}, \
+            f"Expected zero counts for every family, got {result}"
+
+    def test_shared_keyword_counts_in_every_family(self, matcher_module):
+        """Test: a keyword listed in several families is credited to each of them"""
+        families = {"moderate": ["assurance", "verification"], "high": ["assurance", "audit"]}
+
+        result = matcher_module.KeywordMatcher(families).count("third-party assurance")
+
+        assert result["moderate"] == 1, f"Expected 1 moderate hit, got {result['moderate']}"
+        assert result["high"] == 1, f"Expected 1 high hit, got {result['high']}"
+
+    def test_golden_texts_match_naive_scan(self, classify_module, golden_dir):
+        """Test: the shared matcher agrees with naive scans on every golden classification text"""
+        with open(golden_dir / "classification_cases.json", "r") as f:
+            cases = json.load(f)
+
+        families = classify_module.KEYWORD_FAMILIES
+        for case in cases:
+            input_data = case["input"]
+            document = f"{input_data['title']} {input_data.get('summary', '')} {input_data['text']}"
+            result = classify_module.KEYWORD_MATCHER.count(document)
+
+            assert result == self.naive_counts(families, document), \
+                f"Case {case['id']}: matcher counts differ from naive scan"
+
+    def test_classify_policy_scans_document_once(self, classify_module):
+        """Test: classify_policy makes a single matcher pass per document"""
+        matcher = classify_module.KEYWORD_MATCHER
+
+        with patch.object(matcher, "count", wraps=matcher.count) as spy:
+            classify_module.classify_policy(
+                title="EU ESRS Update",
+                text="Companies must disclose supplier emissions with third-party assurance.",
+                jurisdiction="EU",
+                source="European Commission",
+            )
+
+        assert spy.call_count == 1, \
+            f"classify_policy should scan the document once, scanned {spy.call_count} times"
+
+    def test_streaming_scan_matches_single_pass_at_every_split(self, matcher_module):
+        """Test: feeding text in two chunks gives the same counts for every split point"""
+        families = {
+            "mandatory": ["mandatory", "must"],
+            "scope_3": ["value chain", "supplier"],
+        }
+        text = "Suppliers must report value chain data; this is mandatory."
+        matcher = matcher_module.KeywordMatcher(families)
+        expected = matcher.count(text)
+
+        for split in range(len(text) + 1):
+            scanner = matcher.stream()
+            scanner.feed(text[:split])
+            scanner.feed(text[split:])
+
+            assert scanner.counts == expected, \
+                f"Split at {split} ({text[:split]!r} | {text[split:]!r}) changed counts: {scanner.counts}"
@@ -0,0 +1,113 @@
+"""
+Unit tests for MinHash signatures and LSH banding used for near-duplicate detection
+"""
+import pytest
+import subprocess
+import sys
+
+
+BASE_TEXT = (
+    "The Commission shall require large undertakings to disclose scope 1, scope 2 and scope 3 "
+    "greenhouse gas emissions in their annual management report, starting with financial years "
+    "beginning on or after 1 January 2026. Disclosures shall be subject to limited assurance "
+    "by an independent auditor and shall follow the European sustainability reporting standards."
+)
+REWORDED_TEXT = BASE_TEXT.replace("The Commission shall", "The European Commission shall").replace(
+    "annual management report", "annual management reports"
+)
+UNRELATED_TEXT = (
+    "This regulation establishes a carbon border adjustment mechanism for imports of cement, iron, "
+    "steel, aluminium, fertilisers and electricity, with certificates priced against the weekly "
+    "average auction price of emission allowances under the EU emissions trading system."
+)
+
+
+@pytest.mark.unit
+class TestMinHash:
+    """Test signature similarity, LSH candidate lookup and determinism"""
+
+    @pytest.fixture
+    def dedup(self):
+        """Import near-duplicate detection module
+
+        This will use the actual implementation when available.
+        """
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import dedup
+            return dedup
+        except ImportError:
+            try:
+                from backend.app.core import dedup
+                return dedup
+            except ImportError:
+                pytest.skip("Backend dedup module not available - skipping MinHash tests")
+
+    def test_signature_shape(self, dedup):
+        """Test: a signature has NUM_PERM integer slots"""
+        signature = dedup.minhash_signature(BASE_TEXT)
+
+        assert len(signature) == dedup.NUM_PERM
+        assert all(isinstance(value, int) for value in signature)
+
+    def test_near_duplicate_similarity(self, dedup):
+        """Test: reworded copies score above the threshold, unrelated texts well below it"""
+        base = dedup.minhash_signature(BASE_TEXT)
+
+        assert dedup.estimate_similarity(base, dedup.minhash_signature(BASE_TEXT)) == 1.0
+        assert dedup.estimate_similarity(base, dedup.minhash_signature(REWORDED_TEXT)) >= \
+            dedup.NEAR_DUPLICATE_THRESHOLD
+        assert dedup.estimate_similarity(base, dedup.minhash_signature(UNRELATED_TEXT)) < 0.3
+
+    def test_signature_ignores_formatting(self, dedup):
+        """Test: signatures are built from normalized text"""
+        reformatted = "  " + BASE_TEXT.upper().replace(" ", "\n  ")
+
+        assert dedup.minhash_signature(reformatted) == dedup.minhash_signature(BASE_TEXT)
+
+    def test_signature_stable_across_processes(self, dedup):
+        """Test: signatures do not depend on per-process hash randomization"""
+        code = (
+            "import sys; sys.path[:0] = sys.argv[1:]; "
+            "from app.core.dedup import minhash_signature; "
+            f"print(list(minhash_signature({BASE_TEXT!r})))"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code, *sys.path],
+                capture_output=True, text=True, check=True,
+                env={"PYTHONHASHSEED": seed},
+            ).stdout
+            for seed in ("1", "2")
+        }
+
+        assert len(outputs) == 1, "Stored signatures must be comparable between processes"
+        assert outputs.pop().strip() == str(list(dedup.minhash_signature(BASE_TEXT)))
+
+    def test_lsh_index_finds_candidates(self, dedup):
+        """Test: LSH lookup returns near duplicates and not unrelated documents"""
+        index = dedup.LshIndex()
+        index.add(1, dedup.minhash_signature(BASE_TEXT))
+        index.add(2, dedup.minhash_signature(UNRELATED_TEXT))
+
+        candidates = index.query(dedup.minhash_signature(REWORDED_TEXT))
+
+        assert 1 in candidates, "Reworded copy should collide with the original in at least one band"
+        assert 2 not in candidates, "Unrelated document should not be a candidate"
+
+    def test_band_keys_round_trip(self, dedup):
+        """Test: band keys can be stored and used to rebuild the index incrementally"""
+        signature = dedup.minhash_signature(BASE_TEXT)
+        keys = dedup.band_keys(signature)
+
+        assert len(keys) == dedup.NUM_BANDS
+        assert dedup.NUM_PERM % dedup.NUM_BANDS == 0, "Bands must split the signature evenly"
+        assert keys == dedup.band_keys(dedup.minhash_signature(BASE_TEXT))
+        assert set(keys) & set(dedup.band_keys(dedup.minhash_signature(REWORDED_TEXT))), \
+            "Near duplicates should share at least one band key"
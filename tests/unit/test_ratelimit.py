@@ -0,0 +1,173 @@
+"""
+Unit tests for the shared per-host token-bucket rate limiter used by fetchers
+"""
+import pytest
+import asyncio
+import time
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test token buckets, burst allowance, Retry-After and backoff"""
+
+    @pytest.fixture
+    def ratelimit(self):
+        """Import rate limiter module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.ingest import ratelimit
+            return ratelimit
+        except ImportError:
+            try:
+                from backend.app.ingest import ratelimit
+                return ratelimit
+            except ImportError:
+                pytest.skip("Backend rate limiter not available - skipping rate limiter tests")
+
+    @pytest.mark.asyncio
+    async def test_burst_then_steady_rate(self, ratelimit):
+        """Test: `burst` requests go through immediately, the rest at `rate` per second"""
+        limiter = ratelimit.RateLimiter(default_rate=10.0, default_burst=5)
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("api.example.org") for _ in range(5)))
+        burst_elapsed = time.monotonic() - started
+
+        await asyncio.gather(*(limiter.acquire("api.example.org") for _ in range(10)))
+        total_elapsed = time.monotonic() - started
+
+        assert burst_elapsed < 0.1, f"Burst of 5 should not wait, took {burst_elapsed:.2f}s"
+        assert total_elapsed >= 0.9, f"10 more requests at 10/s should take ~1s, took {total_elapsed:.2f}s"
+
+    @pytest.mark.asyncio
+    async def test_hosts_have_independent_buckets(self, ratelimit):
+        """Test: exhausting one host's bucket does not delay another host"""
+        limiter = ratelimit.RateLimiter(
+            default_rate=100.0,
+            default_burst=10,
+            host_limits={"slow.example.org": (1.0, 1)},
+        )
+
+        await limiter.acquire("slow.example.org")
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("fast.example.org") for _ in range(10)))
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.1, f"Other hosts should not wait on an exhausted bucket, took {elapsed:.2f}s"
+
+    @pytest.mark.asyncio
+    async def test_cpdb_limit_is_one_request_per_second(self, ratelimit):
+        """Test: the default cpdb host limit keeps the documented 1 req/sec"""
+        limiter = ratelimit.RateLimiter.default()
+        host = ratelimit.CPDB_HOST
+
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire(host)
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 1.9, f"3 cpdb requests at 1 req/sec should take >= 2s, took {elapsed:.2f}s"
+
+    @pytest.mark.asyncio
+    async def test_retry_after_honored(self, ratelimit):
+        """Test: a 429 with Retry-After blocks the host for that long"""
+        limiter = ratelimit.RateLimiter(default_rate=100.0, default_burst=10)
+
+        limiter.record_response("api.example.org", status=429, retry_after="1")
+        started = time.monotonic()
+        await limiter.acquire("api.example.org")
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.95, f"Retry-After: 1 should delay the next request by 1s, waited {elapsed:.2f}s"
+
+    @pytest.mark.asyncio
+    async def test_success_clears_backoff(self, ratelimit):
+        """Test: a successful response resets the failure streak"""
+        limiter = ratelimit.RateLimiter(default_rate=100.0, default_burst=10)
+
+        limiter.record_response("api.example.org", status=503)
+        limiter.record_response("api.example.org", status=200)
+
+        assert limiter.failures("api.example.org") == 0, "Success should reset consecutive failures"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_error_without_retry_after_backs_off(self, ratelimit, status):
+        """Test: a 429/5xx without Retry-After delays the next acquire by backoff_delay(failures)"""
+        from unittest.mock import patch
+
+        limiter = ratelimit.RateLimiter(default_rate=100.0, default_burst=10)
+
+        with patch.object(ratelimit, "backoff_delay", return_value=0.5) as backoff:
+            limiter.record_response("api.example.org", status=status)
+            started = time.monotonic()
+            await limiter.acquire("api.example.org")
+            elapsed = time.monotonic() - started
+
+        assert limiter.failures("api.example.org") == 1
+        assert backoff.call_args.args[0] == limiter.failures("api.example.org"), \
+            f"Backoff should use the failure count as the attempt, got {backoff.call_args}"
+        assert elapsed >= 0.45, f"HTTP {status} should delay the next request by the backoff, waited {elapsed:.2f}s"
+
+    def test_exponential_backoff_with_jitter(self, ratelimit):
+        """Test: backoff grows exponentially, is jittered, and is capped"""
+        delays = [ratelimit.backoff_delay(attempt, base=0.5, cap=30.0) for attempt in range(8) for _ in range(20)]
+
+        for attempt in range(8):
+            samples = delays[attempt * 20:(attempt + 1) * 20]
+            upper = min(30.0, 0.5 * 2 ** attempt)
+            assert all(0 <= d <= upper for d in samples), \
+                f"Attempt {attempt}: delays should be within [0, {upper}], got {samples}"
+        assert len(set(delays[-20:])) > 1, "Backoff should be jittered, not constant"
+
+    def test_fetchers_share_one_limiter(self, ratelimit):
+        """Test: every fetcher from get_fetcher uses the same process-wide limiter"""
+        try:
+            from app.ingest.fetchers import get_fetcher
+        except ImportError:
+            pytest.skip("Backend fetchers not available")
+
+        cpdb = get_fetcher("cpdb")
+        usfr = get_fetcher("usfr")
+
+        assert cpdb.rate_limiter is usfr.rate_limiter, "Fetchers should share one RateLimiter"
+        assert isinstance(cpdb.rate_limiter, ratelimit.RateLimiter)
+
+    @pytest.mark.asyncio
+    async def test_paginated_fetch_concurrent_up_to_budget(self, ratelimit):
+        """Test: pages are requested concurrently as fast as the host budget allows"""
+        try:
+            from app.ingest.fetchers import fetch_pages
+        except ImportError:
+            pytest.skip("Backend fetchers not available")
+
+        limiter = ratelimit.RateLimiter(default_rate=10.0, default_burst=5)
+        started_at = []
+        in_flight = {"now": 0, "peak": 0}
+
+        async def fetch_page(page):
+            started_at.append(time.monotonic())
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.2)  # network latency per page
+            in_flight["now"] -= 1
+            return [f"item-{page}"]
+
+        started = time.monotonic()
+        pages = await fetch_pages(fetch_page, range(10), host="api.example.org", limiter=limiter)
+        elapsed = time.monotonic() - started
+
+        assert pages == [[f"item-{page}"] for page in range(10)], "Pages should come back in page order"
+        assert in_flight["peak"] > 1, "Pages should be requested concurrently, not one after another"
+        assert elapsed < 1.2, f"10 pages at 10/s with burst 5 should take ~0.7s, serial takes 2s; took {elapsed:.2f}s"
+        assert max(started_at) - started >= 0.45, "Requests beyond the burst should still wait for the bucket"
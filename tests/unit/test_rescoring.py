@@ -0,0 +1,73 @@
+"""
+Unit tests for time-proximity boundary tracking used by incremental rescoring
+"""
+import pytest
+from datetime import date, timedelta
+
+
+@pytest.mark.unit
+class TestTimeProximityBoundaries:
+    """Test next boundary-crossing date calculation for stored impact scores"""
+
+    @pytest.fixture
+    def rescoring(self):
+        """Import rescoring module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import rescoring
+            return rescoring
+        except ImportError:
+            try:
+                from backend.app.core import rescoring
+                return rescoring
+            except ImportError:
+                pytest.skip("Backend rescoring module not available - skipping rescoring tests")
+
+    def test_far_future_crosses_into_12_24_month_band(self, rescoring):
+        """Test: >730 days out → next boundary is when 730 days remain"""
+        today = date(2025, 10, 15)
+        effective_date = date(2028, 1, 1)
+
+        boundary = rescoring.next_boundary_date(effective_date, today)
+
+        assert boundary == effective_date - timedelta(days=730), \
+            f"Expected boundary at 730 days before effective date, got {boundary}"
+
+    def test_12_24_month_band_crosses_into_12_month_band(self, rescoring):
+        """Test: 366-730 days out → next boundary is when 365 days remain"""
+        today = date(2025, 10, 15)
+        effective_date = date(2027, 6, 1)
+
+        boundary = rescoring.next_boundary_date(effective_date, today)
+
+        assert boundary == effective_date - timedelta(days=365), \
+            f"Expected boundary at 365 days before effective date, got {boundary}"
+
+    def test_within_12_months_has_no_further_boundary(self, rescoring):
+        """Test: ≤365 days out (or already effective) → band never changes again"""
+        today = date(2025, 10, 15)
+
+        assert rescoring.next_boundary_date(date(2026, 1, 1), today) is None
+        assert rescoring.next_boundary_date(date(2024, 1, 1), today) is None
+
+    def test_boundary_day_matches_scoring_rules(self, rescoring):
+        """Test: on the boundary date the band matches scoring.md (exactly 730 → +10, 365 → +20)"""
+        effective_date = date(2028, 1, 1)
+        first = rescoring.next_boundary_date(effective_date, date(2025, 10, 15))
+
+        assert rescoring.time_proximity_band(effective_date, first - timedelta(days=1)) == 0
+        assert rescoring.time_proximity_band(effective_date, first) == 10
+
+        second = rescoring.next_boundary_date(effective_date, first)
+        assert rescoring.time_proximity_band(effective_date, second - timedelta(days=1)) == 10
+        assert rescoring.time_proximity_band(effective_date, second) == 20
@@ -0,0 +1,97 @@
+"""
+Unit tests for compiling and loading the binary ruleset artifact
+"""
+import pytest
+
+
+@pytest.mark.unit
+class TestRulesetArtifact:
+    """Test that the compiled ruleset artifact round-trips contracts/ruleset.yml"""
+
+    @pytest.fixture
+    def ruleset_module(self):
+        """Import ruleset module
+
+        This will use the actual implementation when available.
+        """
+        import sys
+        from pathlib import Path
+
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+
+        try:
+            from app.core import ruleset
+            return ruleset
+        except ImportError:
+            try:
+                from backend.app.core import ruleset
+                return ruleset
+            except ImportError:
+                pytest.skip("Backend ruleset module not available - skipping artifact tests")
+
+    @pytest.fixture
+    def artifact(self, ruleset_module, contracts_dir, tmp_path):
+        """Compile contracts/ruleset.yml into a temporary artifact"""
+        out = tmp_path / "ruleset.bin"
+        ruleset_module.compile_ruleset(contracts_dir / "ruleset.yml", out)
+        return out
+
+    def test_artifact_carries_ruleset_version(self, ruleset_module, contracts_dir, artifact):
+        """Test: loaded artifact reports the version declared in ruleset.yml"""
+        import yaml
+
+        with open(contracts_dir / "ruleset.yml", "r") as f:
+            declared = yaml.safe_load(f)
+
+        loaded = ruleset_module.load_ruleset(artifact)
+
+        assert loaded.version == declared["version"], \
+            f"Artifact version {loaded.version} should equal ruleset.yml version {declared['version']}"
+
+    @staticmethod
+    def overlapping_count(text, keyword):
+        """Reference count of every (possibly overlapping) keyword occurrence"""
+        total = 0
+        start = text.find(keyword)
+        while start != -1:
+            total += 1
+            start = text.find(keyword, start + 1)
+        return total
+
+    def test_artifact_matcher_matches_source_keywords(self, ruleset_module, contracts_dir, artifact):
+        """Test: the compiled automaton finds the same hits as the declared keyword lists"""
+        import yaml
+
+        with open(contracts_dir / "ruleset.yml", "r") as f:
+            declared = yaml.safe_load(f)
+
+        loaded = ruleset_module.load_ruleset(artifact)
+        text = "Companies must disclose supplier-level data with third-party assurance across all sectors."
+        hits = loaded.matcher.count(text)
+
+        for group, families in declared["keyword_families"].items():
+            for family, keywords in families.items():
+                expected = sum(self.overlapping_count(text.lower(), keyword) for keyword in keywords)
+                assert hits[f"{group}.{family}"] == expected, \
+                    f"{group}.{family}: artifact found {hits[f'{group}.{family}']} hits, expected {expected}"
+
+    def test_artifact_weights_match_source(self, ruleset_module, contracts_dir, artifact):
+        """Test: weight tables survive compilation unchanged"""
+        import yaml
+
+        with open(contracts_dir / "ruleset.yml", "r") as f:
+            declared = yaml.safe_load(f)
+
+        loaded = ruleset_module.load_ruleset(artifact)
+
+        assert loaded.weights == declared["weights"], "Artifact weights should equal ruleset.yml weights"
+
+    def test_stale_artifact_rejected(self, ruleset_module, artifact):
+        """Test: loading refuses an artifact whose version differs from the expected one"""
+        loaded = ruleset_module.load_ruleset(artifact)
+
+        with pytest.raises(ValueError):
+            ruleset_module.load_ruleset(artifact, expected_version=loaded.version + 1)
@@ -413,3 +413,119 @@ class TestScoring:
         assert impact_factors1 == impact_factors2, \
             "Impact factors should be deterministic (same input → same output)"
 
+
+@pytest.mark.unit
+@pytest.mark.golden
+class TestBatchScoring:
+    """Test vectorized batch scorer against golden scoring cases"""
+
+    # Disclosure complexity levels as passed to the batch scorer
+    DISCLOSURE_LEVELS = {"none": 0, "basic": 1, "moderate": 2, "high": 3}
+
+    FACTOR_NAMES = ["mandatory", "time_proximity", "scope_coverage", "sector_breadth", "disclosure_complexity"]
+
+    @pytest.fixture
+    def np(self):
+        """NumPy is required by the batch scorer"""
+        return pytest.importorskip("numpy")
+
+    @pytest.fixture
+    def scoring_cases(self, golden_dir):
+        """Load golden scoring test cases"""
+        cases_file = golden_dir / "scoring_cases.json"
+        with open(cases_file, "r") as f:
+            return json.load(f)
+
+    @pytest.fixture
+    def batch_score_func(self, np):
+        """Import batch scoring function
+        
+        This will use the actual implementation when available.
+        """
+        import sys
+        
+        # Add backend to path
+        backend_dir = Path(__file__).parent.parent.parent / "PolicyRadar-backend"
+        if str(backend_dir) not in sys.path:
+            sys.path.insert(0, str(backend_dir))
+        
+        try:
+            from app.core.scoring import calculate_impact_scores_batch
+            return calculate_impact_scores_batch
+        except ImportError:
+            try:
+                from backend.app.core.scoring import calculate_impact_scores_batch
+                return calculate_impact_scores_batch
+            except ImportError:
+                pytest.skip("Backend batch scoring function not available - skipping batch tests")
+
+    def to_columns(self, np, inputs):
+        """Convert scalar scoring inputs to the batch scorer's columnar arguments"""
+        return {
+            "mandatory": np.array([i["mandatory"] for i in inputs], dtype=bool),
+            "effective_dates": np.array([i["effective_date"] for i in inputs], dtype="datetime64[D]"),
+            # Bit 0 = Scope 1, bit 1 = Scope 2, bit 2 = Scope 3
+            "scope_masks": np.array(
+                [sum(1 << (scope - 1) for scope in i["scopes"]) for i in inputs], dtype=np.uint8
+            ),
+            "sector_counts": np.array([len(i.get("sectors", [])) for i in inputs], dtype=np.int32),
+            "disclosure_levels": np.array(
+                [self.DISCLOSURE_LEVELS[i.get("disclosure_complexity", "none")] for i in inputs],
+                dtype=np.uint8,
+            ),
+        }
+
+    def test_batch_matches_golden_cases(self, np, batch_score_func, scoring_cases):
+        """Test: batch scores and factors match every golden case in one call"""
+        inputs = [case["input"] for case in scoring_cases]
+        reference_date = date.fromisoformat(inputs[0]["reference_date"])
+        assert all(i["reference_date"] == inputs[0]["reference_date"] for i in inputs), \
+            "Golden scoring cases should share one reference_date"
+        
+        scores, factors = batch_score_func(**self.to_columns(np, inputs), reference_date=reference_date)
+        
+        assert len(scores) == len(scoring_cases), \
+            f"Expected {len(scoring_cases)} scores, got {len(scores)}"
+        assert np.issubdtype(scores.dtype, np.integer), f"Scores should be integers, got {scores.dtype}"
+        assert list(factors.dtype.names) == self.FACTOR_NAMES, \
+            f"Factor fields mismatch. Expected: {self.FACTOR_NAMES}, Got: {factors.dtype.names}"
+        
+        for i, case in enumerate(scoring_cases):
+            expected = case["expected"]
+            assert int(scores[i]) == expected["impact_score"], \
+                f"Case {case['id']}: impact_score mismatch. Expected: {expected['impact_score']}, Got: {scores[i]}"
+            for name in self.FACTOR_NAMES:
+                assert int(factors[name][i]) == expected["impact_factors"][name], \
+                    f"Case {case['id']}: {name} factor mismatch. Expected: {expected['impact_factors'][name]}, Got: {factors[name][i]}"
+
+    def test_batch_time_proximity_boundaries(self, np, batch_score_func):
+        """Test: 365/366 and 730/731 day boundaries match the scalar rules"""
+        reference_date = date(2025, 10, 15)
+        effective_dates = ["2026-10-15", "2026-10-16", "2027-10-15", "2027-10-16"]
+        inputs = [
+            {"mandatory": True, "effective_date": d, "scopes": [1], "sectors": ["energy"]}
+            for d in effective_dates
+        ]
+        
+        _, factors = batch_score_func(**self.to_columns(np, inputs), reference_date=reference_date)
+        
+        assert factors["time_proximity"].tolist() == [20, 10, 10, 0], \
+            f"Time proximity boundaries mismatch, got {factors['time_proximity'].tolist()}"
+
+    def test_batch_uses_explicit_reference_date(self, np, batch_score_func):
+        """Test: the batch scorer uses reference_date, not date.today()"""
+        inputs = [{"mandatory": True, "effective_date": "2026-01-01", "scopes": [1], "sectors": ["energy"]}]
+        columns = self.to_columns(np, inputs)
+        
+        _, near = batch_score_func(**columns, reference_date=date(2025, 10, 15))
+        _, far = batch_score_func(**columns, reference_date=date(2023, 1, 1))
+        
+        assert int(near["time_proximity"][0]) == 20, "Effective in <=365 days should get +20"
+        assert int(far["time_proximity"][0]) == 0, "Effective in >730 days should get +0"
+
+    def test_batch_empty_input(self, np, batch_score_func):
+        """Test: empty columns return empty results"""
+        scores, factors = batch_score_func(**self.to_columns(np, []), reference_date=date(2025, 10, 15))
+        
+        assert len(scores) == 0, "Empty input should return no scores"
+        assert len(factors) == 0, "Empty input should return no factors"